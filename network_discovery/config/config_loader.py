@@ -10,6 +10,15 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from ..utils.logger import Logger
+from ..utils.error_handler import ConfigurationError
+
+
+# Protocol names accepted for SNMPv3 users
+SNMPV3_AUTH_PROTOCOLS = ("none", "md5", "sha", "sha224", "sha256", "sha384", "sha512")
+SNMPV3_PRIV_PROTOCOLS = ("none", "des", "3des", "aes", "aes192", "aes256")
+
+# Shortest USM passphrase accepted by SNMP agents (RFC 3414)
+SNMPV3_MIN_KEY_LENGTH = 8
 
 
 @dataclass
@@ -48,8 +57,13 @@ class SNMPConfig:
     retries: int = 2
     max_oids_per_request: int = 10
     max_walk_oids: int = 100
+    max_repetitions: int = 25
+    max_concurrency: Optional[int] = None  # None scales with the number of targets
+    fast_mode: bool = False  # Probe all targets from one socket before walking
+    capture_raw: bool = False  # Keep formatted raw output in the scan result
     walk_oids: list = None
     specific_oids: list = None
+    snmpv3_users: list = None  # USM users tried when version 3 is enabled
     
     def __post_init__(self):
         if self.versions is None:
@@ -61,6 +75,8 @@ class SNMPConfig:
             ]
         if self.specific_oids is None:
             self.specific_oids = []
+        if self.snmpv3_users is None:
+            self.snmpv3_users = []
 
 
 class ConfigLoader:
@@ -209,18 +225,25 @@ class ConfigLoader:
                 retries=self._validate_positive_int(snmp_data.get('retries', 2), 'retries', 2),
                 max_oids_per_request=self._validate_positive_int(snmp_data.get('max_oids_per_request', 10), 'max_oids_per_request', 10),
                 max_walk_oids=self._validate_positive_int(snmp_data.get('max_walk_oids', 100), 'max_walk_oids', 100),
+                max_repetitions=self._validate_positive_int(snmp_data.get('max_repetitions', 25), 'max_repetitions', 25),
+                max_concurrency=self._validate_optional_positive_int(snmp_data.get('max_concurrency'), 'max_concurrency'),
+                fast_mode=self._validate_bool(snmp_data.get('fast_mode', False), 'fast_mode', False),
+                capture_raw=self._validate_bool(snmp_data.get('capture_raw', False), 'capture_raw', False),
                 walk_oids=snmp_data.get('walk_oids', [
                     "1.3.6.1.2.1.1",  # System info
                     "1.3.6.1.2.1.2",  # Interfaces
                     "1.3.6.1.2.1.4"   # IP info
                 ]),
-                specific_oids=snmp_data.get('specific_oids', [])
+                specific_oids=snmp_data.get('specific_oids', []),
+                snmpv3_users=self._validate_snmpv3_users(snmp_data.get('snmpv3_users', []))
             )
             
         except yaml.YAMLError as e:
             self.logger.error(f"Error parsing SNMP config file {config_path}: {e}")
             self.logger.warning("Using default SNMP configuration.")
             return SNMPConfig()
+        except ConfigurationError:
+            raise
         except Exception as e:
             self.logger.error(f"Unexpected error loading SNMP config: {e}")
             self.logger.warning("Using default SNMP configuration.")
@@ -248,6 +271,41 @@ class ConfigLoader:
             self.logger.warning(f"Invalid {field_name}: {value}. Must be an integer. Using default: {default}")
             return default
     
+    def _validate_optional_positive_int(self, value: Any, field_name: str) -> Optional[int]:
+        """
+        Validate an optional positive integer, where None means "automatic".
+        
+        Args:
+            value: Value to validate
+            field_name: Name of the field for error messages
+            
+        Returns:
+            Validated integer value or None
+        """
+        if value is None:
+            return None
+        return self._validate_positive_int(value, field_name, None)
+    
+    def _validate_bool(self, value: Any, field_name: str, default: bool) -> bool:
+        """
+        Validate that a value is a boolean.
+        
+        Only YAML booleans are accepted; strings such as "false" would be
+        truthy under bool() and silently enable the flag.
+        
+        Args:
+            value: Value to validate
+            field_name: Name of the field for error messages
+            default: Default value to use if validation fails
+            
+        Returns:
+            Validated boolean value or default
+        """
+        if isinstance(value, bool):
+            return value
+        self.logger.warning(f"Invalid {field_name}: {value!r}. Must be true or false. Using default: {default}")
+        return default
+    
     def _validate_method(self, method: str) -> str:
         """
         Validate ARP scanning method.
@@ -291,6 +349,67 @@ class ConfigLoader:
         
         return valid_versions
     
+    def _validate_snmpv3_users(self, users: Any) -> list:
+        """
+        Validate SNMPv3 user entries.
+        
+        Protocols default to SHA and AES when only the matching key is set.
+        
+        Args:
+            users: User entries to validate
+            
+        Returns:
+            List of normalized user dictionaries
+            
+        Raises:
+            ConfigurationError: If a key is shorter than SNMPV3_MIN_KEY_LENGTH
+        """
+        if users is None:
+            return []
+        if not isinstance(users, list):
+            self.logger.warning(f"Invalid snmpv3_users: {users}. Must be a list. Ignoring.")
+            return []
+        
+        valid_users = []
+        for user in users:
+            if not isinstance(user, dict) or not user.get('username'):
+                self.logger.warning(f"Invalid SNMPv3 user: {user}. A username is required. Skipping.")
+                continue
+            
+            auth_key = user.get('auth_key') or None
+            priv_key = user.get('priv_key') or None
+            auth_protocol = str(user.get('auth_protocol', 'sha' if auth_key else 'none')).lower()
+            priv_protocol = str(user.get('priv_protocol', 'aes' if priv_key else 'none')).lower()
+            
+            if auth_protocol not in SNMPV3_AUTH_PROTOCOLS:
+                self.logger.warning(f"Invalid auth_protocol for SNMPv3 user {user['username']}: {auth_protocol}. Must be one of {list(SNMPV3_AUTH_PROTOCOLS)}. Skipping.")
+                continue
+            if priv_protocol not in SNMPV3_PRIV_PROTOCOLS:
+                self.logger.warning(f"Invalid priv_protocol for SNMPv3 user {user['username']}: {priv_protocol}. Must be one of {list(SNMPV3_PRIV_PROTOCOLS)}. Skipping.")
+                continue
+            if (auth_protocol != 'none') != bool(auth_key) or (priv_protocol != 'none') != bool(priv_key):
+                self.logger.warning(f"SNMPv3 user {user['username']} needs a key for each protocol in use. Skipping.")
+                continue
+            if priv_key and not auth_key:
+                self.logger.warning(f"SNMPv3 user {user['username']} uses privacy without authentication. Skipping.")
+                continue
+            for key_name, key in (('auth_key', auth_key), ('priv_key', priv_key)):
+                if key and len(str(key)) < SNMPV3_MIN_KEY_LENGTH:
+                    raise ConfigurationError(
+                        f"{key_name} of SNMPv3 user {user['username']} must be at least "
+                        f"{SNMPV3_MIN_KEY_LENGTH} characters"
+                    )
+            
+            valid_users.append({
+                'username': str(user['username']),
+                'auth_protocol': auth_protocol,
+                'auth_key': auth_key,
+                'priv_protocol': priv_protocol,
+                'priv_key': priv_key,
+            })
+        
+        return valid_users
+    
     def create_default_configs(self) -> None:
         """
         Create default configuration files if they don't exist.
@@ -369,6 +488,10 @@ class ConfigLoader:
                 'retries': 2,
                 'max_oids_per_request': 10,
                 'max_walk_oids': 100,
+                'max_repetitions': 25,
+                'fast_mode': False,
+                'capture_raw': False,
+                'snmpv3_users': [],
                 'walk_oids': [
                     '1.3.6.1.2.1.1',  # System info
                     '1.3.6.1.2.1.2',  # Interfaces
@@ -32,6 +32,38 @@ from ..utils.json_reporter import JSONReporter
 from ..utils.error_handler import ErrorHandler, ErrorContext, ErrorType, ErrorSeverity, NetworkError
 
 
+# SNMPv3 user fields holding USM key material
+_SNMPV3_SECRET_FIELDS = ("auth_key", "priv_key")
+
+
+def _redact_snmp_config(snmp_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Mask SNMPv3 USM keys in an SNMP configuration dictionary.
+
+    The configuration is written verbatim into every report, so keys are
+    replaced while usernames and protocols are kept.
+
+    Args:
+        snmp_config: SNMP configuration as returned by asdict
+
+    Returns:
+        Dict[str, Any]: Copy of the configuration with keys redacted
+    """
+    users = snmp_config.get("snmpv3_users") or []
+    return {
+        **snmp_config,
+        "snmpv3_users": [
+            {
+                field: "<redacted>"
+                if field in _SNMPV3_SECRET_FIELDS and value
+                else value
+                for field, value in user.items()
+            }
+            for user in users
+        ],
+    }
+
+
 class ScannerOrchestrator:
     """
     Orchestrates the complete network discovery scan pipeline.
@@ -210,7 +242,7 @@ class ScannerOrchestrator:
             self.configurations = {
                 "arp": asdict(arp_config),
                 "nmap": asdict(nmap_config),
-                "snmp": asdict(snmp_config),
+                "snmp": _redact_snmp_config(asdict(snmp_config)),
             }
 
             self.logger.progress_end("Configuration loading completed")
@@ -545,7 +577,8 @@ class ScannerOrchestrator:
             # Update with NMAP data
             merged_device = merged_devices[ip]
             merged_device.os_info = device.os_info
-            merged_device.open_ports = device.open_ports.copy()
+            # Sorted once here rather than on every report generation
+            merged_device.open_ports = sorted(device.open_ports)
             merged_device.services = device.services.copy()
 
             # Update hostname if not set and available from NMAP
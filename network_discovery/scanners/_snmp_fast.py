@@ -0,0 +1,441 @@
+"""
+Lightweight SNMP reachability probe for the SNMP scanner.
+
+Encodes SNMPv1/v2c GetRequest messages by hand and sends them to every
+target from a single non-blocking UDP socket, so thousands of hosts can be
+probed without creating a pysnmp engine, transport and request per attempt.
+Only the fields needed to match replies (request-id and error-status) are
+decoded; the scanner still uses pysnmp for the actual walks. Also provides a
+connected-socket watcher that notices ICMP port-unreachable replies, which
+pysnmp's unconnected sockets never see.
+
+Replies to a sweep arrive in a burst, so the probe socket asks for 16 MB
+send and receive buffers. Linux clips the request to net.core.rmem_max /
+net.core.wmem_max (about 208 KB by default); raise them for large sweeps:
+
+    sysctl -w net.core.rmem_max=33554432
+    sysctl -w net.core.wmem_max=33554432
+"""
+
+import asyncio
+import random
+import select
+import socket
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..utils.logger import Logger
+
+# sysDescr.0, answered by practically every SNMP agent
+PROBE_OID = (1, 3, 6, 1, 2, 1, 1, 1, 0)
+
+_TAG_INTEGER = 0x02
+_TAG_OCTET_STRING = 0x04
+_TAG_NULL = 0x05
+_TAG_OID = 0x06
+_TAG_SEQUENCE = 0x30
+_TAG_GET_REQUEST = 0xA0
+_TAG_RESPONSE = 0xA2
+
+# SNMP message version field for each supported protocol version
+_MESSAGE_VERSIONS = {1: 0, 2: 1}
+
+# Requested SO_RCVBUF/SO_SNDBUF for the probe socket
+SOCKET_BUFFER_SIZE = 16 << 20
+
+# Receive buffer space one small reply takes, including kernel overhead
+_REPLY_BUFFER_COST = 1024
+
+
+def _encode_length(length: int) -> bytes:
+    """
+    Encode a BER length field.
+
+    Args:
+        length: Content length in bytes
+
+    Returns:
+        Encoded length octets
+    """
+    if length < 0x80:
+        return bytes((length,))
+    encoded = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes((0x80 | len(encoded),)) + encoded
+
+
+def _tlv(tag: int, value: bytes) -> bytes:
+    """
+    Encode a BER tag-length-value triple.
+
+    Args:
+        tag: Tag octet
+        value: Encoded content
+
+    Returns:
+        Encoded TLV
+    """
+    return bytes((tag,)) + _encode_length(len(value)) + value
+
+
+def _encode_integer(value: int) -> bytes:
+    """
+    Encode a BER INTEGER.
+
+    Args:
+        value: Integer value
+
+    Returns:
+        Encoded INTEGER
+    """
+    return _tlv(
+        _TAG_INTEGER, value.to_bytes(value.bit_length() // 8 + 1, "big", signed=True)
+    )
+
+
+def _encode_oid(oid: Tuple[int, ...]) -> bytes:
+    """
+    Encode a BER OBJECT IDENTIFIER.
+
+    Args:
+        oid: OID as a tuple of integers (at least two arcs)
+
+    Returns:
+        Encoded OBJECT IDENTIFIER
+    """
+    content = bytearray((oid[0] * 40 + oid[1],))
+    for arc in oid[2:]:
+        chunk = bytearray((arc & 0x7F,))
+        arc >>= 7
+        while arc:
+            chunk.insert(0, 0x80 | (arc & 0x7F))
+            arc >>= 7
+        content += chunk
+    return _tlv(_TAG_OID, bytes(content))
+
+
+def encode_get_request(
+    version: int, community: str, request_id: int, oid: Tuple[int, ...] = PROBE_OID
+) -> bytes:
+    """
+    Encode an SNMPv1/v2c GetRequest message for a single OID.
+
+    Args:
+        version: SNMP version (1 or 2)
+        community: SNMP community string
+        request_id: Request identifier echoed back in the response
+        oid: OID to request
+
+    Returns:
+        Encoded SNMP message
+    """
+    varbind = _tlv(_TAG_SEQUENCE, _encode_oid(oid) + _tlv(_TAG_NULL, b""))
+    pdu = _tlv(
+        _TAG_GET_REQUEST,
+        _encode_integer(request_id)
+        + _encode_integer(0)  # error-status
+        + _encode_integer(0)  # error-index
+        + _tlv(_TAG_SEQUENCE, varbind),
+    )
+    return _tlv(
+        _TAG_SEQUENCE,
+        _encode_integer(_MESSAGE_VERSIONS[version])
+        + _tlv(_TAG_OCTET_STRING, community.encode())
+        + pdu,
+    )
+
+
+def _read_tlv(data: bytes, offset: int) -> Tuple[int, int, int]:
+    """
+    Read the header of a BER TLV.
+
+    Args:
+        data: Encoded message
+        offset: Offset of the tag octet
+
+    Returns:
+        Tuple of (tag, content_offset, content_end)
+
+    Raises:
+        ValueError: If the TLV is truncated or malformed
+    """
+    if offset + 2 > len(data):
+        raise ValueError("truncated TLV")
+    tag = data[offset]
+    length = data[offset + 1]
+    offset += 2
+    if length & 0x80:
+        octets = length & 0x7F
+        if not octets or offset + octets > len(data):
+            raise ValueError("unsupported length encoding")
+        length = int.from_bytes(data[offset:offset + octets], "big")
+        offset += octets
+    end = offset + length
+    if end > len(data):
+        raise ValueError("truncated TLV")
+    return tag, offset, end
+
+
+def _read_integer(data: bytes, offset: int) -> Tuple[int, int]:
+    """
+    Read a BER INTEGER.
+
+    Args:
+        data: Encoded message
+        offset: Offset of the tag octet
+
+    Returns:
+        Tuple of (value, offset after the INTEGER)
+
+    Raises:
+        ValueError: If the field is not an INTEGER
+    """
+    tag, start, end = _read_tlv(data, offset)
+    if tag != _TAG_INTEGER:
+        raise ValueError(f"expected INTEGER, got tag 0x{tag:02x}")
+    return int.from_bytes(data[start:end], "big", signed=True), end
+
+
+def decode_response(data: bytes) -> Tuple[int, int]:
+    """
+    Decode the request-id and error-status of an SNMP response message.
+
+    Args:
+        data: Received datagram
+
+    Returns:
+        Tuple of (request_id, error_status)
+
+    Raises:
+        ValueError: If the datagram is not a well-formed SNMP response
+    """
+    tag, offset, _ = _read_tlv(data, 0)
+    if tag != _TAG_SEQUENCE:
+        raise ValueError("not an SNMP message")
+    _, offset = _read_integer(data, offset)  # version
+    tag, _, offset = _read_tlv(data, offset)  # community
+    if tag != _TAG_OCTET_STRING:
+        raise ValueError("missing community")
+    tag, offset, _ = _read_tlv(data, offset)
+    if tag != _TAG_RESPONSE:
+        raise ValueError(f"unexpected PDU tag 0x{tag:02x}")
+    request_id, offset = _read_integer(data, offset)
+    error_status, _ = _read_integer(data, offset)
+    return request_id, error_status
+
+
+def probe_targets(
+    targets: List[str],
+    credentials: List[Tuple[int, str]],
+    timeout: float,
+    retries: int = 0,
+    port: int = 161,
+    logger: Optional[Logger] = None,
+) -> Dict[str, Optional[Tuple[int, str]]]:
+    """
+    Find which targets answer SNMP and with which credentials.
+
+    Every (target, credential) request is sent from one socket before any
+    reply is awaited, so the sweep takes about timeout * (retries + 1)
+    regardless of the number of targets.
+
+    Args:
+        targets: List of IPv4 addresses to probe
+        credentials: (version, community) pairs to try, in preference order;
+            only versions 1 and 2 are probed
+        timeout: Seconds to wait for replies after each send round
+        retries: Additional send rounds for targets that have not answered
+        port: SNMP agent UDP port
+        logger: Logger for socket buffer diagnostics (optional)
+
+    Returns:
+        Dictionary of responding targets mapped to the first credential that
+        got a reply, or None if the target replied with something that could
+        not be decoded
+    """
+    credentials = [cred for cred in credentials if cred[0] in _MESSAGE_VERSIONS]
+    responders: Dict[str, Optional[Tuple[int, str]]] = {}
+    if not targets or not credentials:
+        return responders
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    try:
+        rcvbuf, sndbuf = _enlarge_buffers(sock, SOCKET_BUFFER_SIZE)
+        if logger:
+            message = (
+                f"SNMP probe socket buffers: receive {rcvbuf} bytes, send {sndbuf} "
+                f"bytes (requested {SOCKET_BUFFER_SIZE})"
+            )
+            if rcvbuf < len(targets) * _REPLY_BUFFER_COST:
+                logger.warning(
+                    f"{message}; replies from {len(targets)} targets may be "
+                    "dropped, raise net.core.rmem_max"
+                )
+            else:
+                logger.debug(message)
+
+        pending: Dict[int, Tuple[str, Tuple[int, str]]] = {}
+        next_id = random.randrange(1, 1 << 30)
+        answered = 0
+
+        for _ in range(retries + 1):
+            for target in targets:
+                if responders.get(target):
+                    continue
+                for cred in credentials:
+                    request_id = next_id
+                    next_id = next_id + 1 if next_id < (1 << 31) - 1 else 1
+                    pending[request_id] = (target, cred)
+                    _send(sock, encode_get_request(*cred, request_id), (target, port))
+
+            deadline = time.monotonic() + timeout
+            while answered < len(targets):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([sock], [], [], remaining)[0]:
+                    break
+                answered += _drain(sock, pending, responders)
+
+            if answered == len(targets):
+                break
+    finally:
+        sock.close()
+
+    return responders
+
+
+def _enlarge_buffers(sock: socket.socket, size: int) -> Tuple[int, int]:
+    """
+    Request large socket buffers and report what the kernel granted.
+
+    Args:
+        sock: UDP socket
+        size: Requested buffer size in bytes
+
+    Returns:
+        Tuple of (receive buffer, send buffer) sizes in bytes
+    """
+    for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, size)
+        except OSError:
+            # Keep the default size
+            pass
+    return (
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+        sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+    )
+
+
+def _send(sock: socket.socket, message: bytes, address: Tuple[str, int]) -> None:
+    """
+    Send a datagram, waiting for buffer space if the socket is full.
+
+    Args:
+        sock: Non-blocking UDP socket
+        message: Encoded SNMP message
+        address: Destination (host, port)
+    """
+    while True:
+        try:
+            sock.sendto(message, address)
+            return
+        except BlockingIOError:
+            select.select([], [sock], [], 1.0)
+        except OSError:
+            # Unroutable destination; the target simply never answers
+            return
+
+
+def _drain(
+    sock: socket.socket,
+    pending: Dict[int, Tuple[str, Tuple[int, str]]],
+    responders: Dict[str, Optional[Tuple[int, str]]],
+) -> int:
+    """
+    Read every queued datagram and record the responding targets.
+
+    Args:
+        sock: Non-blocking UDP socket
+        pending: Outstanding requests by request-id
+        responders: Results being collected, updated in place
+
+    Returns:
+        Number of targets that got a working credential
+    """
+    answered = 0
+    while True:
+        try:
+            data, (host, _) = sock.recvfrom(65535)
+        except (BlockingIOError, InterruptedError):
+            return answered
+        except OSError:
+            # Queued ICMP errors and the like; try again on the next wakeup
+            return answered
+
+        try:
+            request_id, _ = decode_response(data)
+        except ValueError:
+            # Let the full pysnmp scan deal with whatever this host speaks
+            responders.setdefault(host, None)
+            continue
+
+        request = pending.get(request_id)
+        if request is None or request[0] != host:
+            continue
+        # Agents drop requests with a wrong community, so any reply - even
+        # an error such as SNMPv1 noSuchName - proves the credential works
+        if not responders.get(host):
+            responders[host] = request[1]
+            answered += 1
+
+
+class PortUnreachableWatcher(asyncio.DatagramProtocol):
+    """
+    Datagram protocol that reports ICMP port-unreachable from its peer.
+
+    Only connected UDP sockets receive ICMP errors, and the kernel surfaces
+    them to asyncio as ConnectionRefusedError.
+    """
+
+    def __init__(self, on_unreachable: Callable[[], None]):
+        """
+        Initialize the watcher.
+
+        Args:
+            on_unreachable: Called once when the port is reported closed
+        """
+        self.unreachable = False
+        self._on_unreachable = on_unreachable
+
+    def error_received(self, exc: Exception) -> None:
+        if isinstance(exc, ConnectionRefusedError) and not self.unreachable:
+            self.unreachable = True
+            self._on_unreachable()
+
+
+async def watch_port_unreachable(
+    target: str,
+    credential: Tuple[int, str],
+    on_unreachable: Callable[[], None],
+    port: int = 161,
+) -> Tuple[asyncio.DatagramTransport, PortUnreachableWatcher]:
+    """
+    Send one GetRequest from a connected socket and watch for ICMP errors.
+
+    Args:
+        target: IPv4 address of the agent
+        credential: (version, community) to send; version must be 1 or 2
+        on_unreachable: Called once if the target reports the port closed
+        port: SNMP agent UDP port
+
+    Returns:
+        Tuple of (transport, watcher); the caller closes the transport
+    """
+    loop = asyncio.get_running_loop()
+    transport, watcher = await loop.create_datagram_endpoint(
+        lambda: PortUnreachableWatcher(on_unreachable), remote_addr=(target, port)
+    )
+    transport.sendto(
+        encode_get_request(*credential, random.randrange(1, 1 << 31))
+    )
+    return transport, watcher
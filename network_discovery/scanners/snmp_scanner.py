@@ -6,10 +6,15 @@ to perform SNMP walks and retrieve device information from SNMP-enabled devices.
 """
 
 import asyncio
+import os
+import re
+import socket
 import time
-import threading
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 
@@ -24,11 +29,45 @@ try:
         ObjectType,
         ObjectIdentity,
         walk_cmd,
+        bulk_walk_cmd,
         get_cmd,
         usmNoAuthProtocol,
         usmNoPrivProtocol,
+        usmHMACMD5AuthProtocol,
+        usmHMACSHAAuthProtocol,
+        usmHMAC128SHA224AuthProtocol,
+        usmHMAC192SHA256AuthProtocol,
+        usmHMAC256SHA384AuthProtocol,
+        usmHMAC384SHA512AuthProtocol,
+        usmDESPrivProtocol,
+        usm3DESEDEPrivProtocol,
+        usmAesCfb128Protocol,
+        usmAesCfb192Protocol,
+        usmAesCfb256Protocol,
     )
     from pysnmp.error import PySnmpError
+    from pysnmp.proto.errind import RequestTimedOut
+    from pysnmp.proto.rfc1902 import OctetString
+    from pysnmp.proto.rfc1905 import NoSuchInstance, NoSuchObject
+
+    # Protocol names accepted in snmpv3_users (see SNMPV3_*_PROTOCOLS)
+    _USM_AUTH_PROTOCOLS = {
+        "none": usmNoAuthProtocol,
+        "md5": usmHMACMD5AuthProtocol,
+        "sha": usmHMACSHAAuthProtocol,
+        "sha224": usmHMAC128SHA224AuthProtocol,
+        "sha256": usmHMAC192SHA256AuthProtocol,
+        "sha384": usmHMAC256SHA384AuthProtocol,
+        "sha512": usmHMAC384SHA512AuthProtocol,
+    }
+    _USM_PRIV_PROTOCOLS = {
+        "none": usmNoPrivProtocol,
+        "des": usmDESPrivProtocol,
+        "3des": usm3DESEDEPrivProtocol,
+        "aes": usmAesCfb128Protocol,
+        "aes192": usmAesCfb192Protocol,
+        "aes256": usmAesCfb256Protocol,
+    }
 
     PYSNMP_AVAILABLE = True
 except ImportError:
@@ -44,11 +83,231 @@ except ImportError:
     class UdpTransportTarget:
         pass
 
+    class ContextData:
+        pass
+
+
+try:
+    # Optional libuv-based event loop with lower per-datagram overhead
+    from uvloop import run as uvloop_run
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 from .base_scanner import BaseScanner, ScanResult
+from ._snmp_fast import probe_targets, watch_port_unreachable
 from ..core.data_models import DeviceInfo, ScanStatus, DeviceType
 from ..config.config_loader import SNMPConfig
 from ..utils.logger import Logger
+from ..utils.manufacturers import match_manufacturer
+
+
+# Patterns for parsing the raw output produced by _scan_targets
+_SECTION_RE = re.compile(r"^=== SNMP Scan: (\S+)(?: ===)?[ \t]*$", re.M)
+_KV_RE = re.compile(r"^  [ \t]*(.+?) = (.*?)[ \t\r]*$", re.M)
+
+# Below this many targets per worker, BER encoding on one event loop costs
+# less than starting processes and pickling their results
+_MIN_TARGETS_PER_PROCESS = 16
+
+
+def _run_async(coro: Any) -> Any:
+    """
+    Run a coroutine on a new event loop, using uvloop when it is installed.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if UVLOOP_AVAILABLE:
+        return uvloop_run(coro)
+    return asyncio.run(coro)
+
+
+@lru_cache(maxsize=256)
+def _object_type(oid: str) -> "ObjectType":
+    """
+    Get a shared ObjectType for an OID.
+
+    pysnmp resolves an ObjectType in place on first use and returns it
+    unchanged afterwards, so one instance can be reused for every target.
+    The dotted string is therefore parsed once per configured OID. The cache
+    is bounded because the OIDs come from configuration, which may be
+    reloaded with different OIDs in a long-running process.
+
+    Args:
+        oid: Dotted OID string
+
+    Returns:
+        ObjectType wrapping the OID
+    """
+    return ObjectType(ObjectIdentity(oid))
+
+
+@lru_cache(maxsize=16384)
+def _oid_to_str(oid: Tuple[int, ...]) -> str:
+    """
+    Convert an OID tuple to its dotted string form.
+
+    Cached because the same OIDs (sysDescr.0, ifDescr.1, ...) come back from
+    every device; repeated keys then also share one string object.
+
+    Args:
+        oid: OID as a tuple of integers
+
+    Returns:
+        Dotted OID string, e.g. "1.3.6.1.2.1.1.1.0"
+    """
+    return ".".join(map(str, oid))
+
+
+def _credentials(config: SNMPConfig) -> List[Tuple[int, str]]:
+    """
+    List the credentials configured for each SNMP version.
+
+    SNMPv1/v2c use the community strings. SNMPv3 uses the configured USM
+    user names, or the community strings as noAuthNoPriv user names when no
+    SNMPv3 users are configured.
+
+    Args:
+        config: SNMP configuration
+
+    Returns:
+        List of (version, community or user name) pairs in configured order
+    """
+    v3_names = [user["username"] for user in config.snmpv3_users] or config.communities
+    return [
+        (version, name)
+        for version in config.versions
+        for name in (v3_names if version == 3 else config.communities)
+    ]
+
+
+def _peer_engine_cache(snmp_engine: SnmpEngine) -> Optional[Dict[Any, Dict[str, Any]]]:
+    """
+    Get the SNMPv3 peer engine ID cache of an SNMP engine.
+
+    pysnmp keeps discovered engine IDs per (transport domain, address) in
+    its SNMPv3 message processing model and offers no public setter. Without
+    the cache every engine ID is simply discovered again.
+
+    Args:
+        snmp_engine: SNMP engine instance
+
+    Returns:
+        The engine's peer cache, or None if this pysnmp has no such cache
+    """
+    return getattr(
+        snmp_engine.message_processing_subsystems.get(3),
+        "_SnmpV3MessageProcessingModel__engineIdCache",
+        None,
+    )
+
+
+async def _create_transport(target: str, config: SNMPConfig) -> UdpTransportTarget:
+    """
+    Create the UDP transport for a target.
+
+    UdpTransportTarget.create() always resolves the address through
+    loop.getaddrinfo(), which is a round-trip through the default executor.
+    Numeric IPv4 targets (the normal case) need no resolution, so the
+    transport is built the same way create() does it, minus the lookup.
+
+    Args:
+        target: IP address or hostname
+        config: SNMP configuration
+
+    Returns:
+        UDP transport target for port 161
+    """
+    try:
+        socket.inet_pton(socket.AF_INET, target)
+    except OSError:
+        return await UdpTransportTarget.create(
+            (target, 161), timeout=config.timeout, retries=config.retries
+        )
+
+    transport_target = UdpTransportTarget.__new__(UdpTransportTarget)
+    transport_target.transport_address = (target, 161)
+    transport_target.__init__(timeout=config.timeout, retries=config.retries)
+    return transport_target
+
+
+class AdaptiveLimiter:
+    """
+    Async concurrency limiter that sizes itself from scan outcomes.
+
+    The limit grows by one for every success observed while all slots are
+    busy and shrinks by 10% for every timeout, staying within
+    [minimum, maximum]. Only targets known to answer count as timeouts;
+    hosts without an agent are neutral, so sparse subnets keep their
+    concurrency. Tasks wait while the number of active scans is at or
+    above the current limit.
+    """
+
+    def __init__(self, initial: int, minimum: int = 8, maximum: int = 512):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial: Starting concurrency limit
+            minimum: Lowest limit to back off to
+            maximum: Highest limit to grow to
+        """
+        self.minimum = min(minimum, maximum)
+        self.maximum = maximum
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.active = 0
+        self.stats = {
+            "started": 0,
+            "successes": 0,
+            "timeouts": 0,
+            "waits": 0,
+            "peak_active": 0,
+        }
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._condition:
+            if self.active >= int(self.limit):
+                self.stats["waits"] += 1
+                await self._condition.wait_for(
+                    lambda: self.active < int(self.limit)
+                )
+            self.active += 1
+            self.stats["started"] += 1
+            self.stats["peak_active"] = max(self.stats["peak_active"], self.active)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self.active -= 1
+            # The limit may have grown, so more than one waiter can proceed
+            self._condition.notify_all()
+
+    def record_success(self) -> None:
+        """Grow the limit if this success was observed under saturation."""
+        self.stats["successes"] += 1
+        if self.active >= int(self.limit):
+            self.limit = min(self.maximum, self.limit + 1)
+
+    def record_timeout(self) -> None:
+        """Back off after a target known to answer failed to respond."""
+        self.stats["timeouts"] += 1
+        self.limit = max(self.minimum, self.limit * 0.9)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Get the limiter counters.
+
+        Returns:
+            Dictionary of counters plus the current limit
+        """
+        return dict(self.stats, limit=int(self.limit))
 
 
 class SNMPScanner(BaseScanner):
@@ -70,7 +329,14 @@ class SNMPScanner(BaseScanner):
         """
         super().__init__(logger, error_handler)
         self.scanner_type = "SNMP"
-        self._lock = threading.Lock()
+        # Last working (version, community) per target and overall success
+        # counts, used to try known-good credentials first. Targets of one
+        # scanner share a single event loop, so no lock is needed.
+        self._cred_cache: Dict[str, Tuple[int, str]] = {}
+        self._cred_hits: Counter = Counter()
+        # SNMPv3 authoritative engine ID per target, so later scans can skip
+        # the engine ID discovery round-trip
+        self._engine_id_cache: Dict[str, bytes] = {}
 
         if not PYSNMP_AVAILABLE:
             self._log_error(
@@ -133,15 +399,17 @@ class SNMPScanner(BaseScanner):
             devices_found=devices,
             scan_duration=scan_duration,
             errors=errors,
-            raw_output=raw_output,
+            raw_output=raw_output if config.capture_raw else None,
             metadata={
                 "versions_tried": config.versions,
                 "communities_tried": config.communities,
                 "targets_scanned": len(valid_targets),
                 "timeout": config.timeout,
                 "retries": config.retries,
+                "max_concurrency": config.max_concurrency,
                 "max_oids_per_request": config.max_oids_per_request,
                 "max_walk_oids": config.max_walk_oids,
+                "max_repetitions": config.max_repetitions,
                 "walk_oids": config.walk_oids,
                 "specific_oids_count": len(config.specific_oids),
             },
@@ -153,6 +421,11 @@ class SNMPScanner(BaseScanner):
         """
         Perform SNMP scan on multiple targets.
 
+        Large target lists are split into one chunk per CPU and scanned in
+        worker processes, so pysnmp's BER encoding is not serialized by the
+        GIL. Small lists, single-CPU hosts and hosts where a process pool
+        cannot be started scan all targets on one event loop in this process.
+
         Args:
             targets: List of IP addresses to scan
             config: SNMP configuration
@@ -163,89 +436,448 @@ class SNMPScanner(BaseScanner):
         devices = []
         errors = []
         all_raw_output = []
+        results = []
+
+        if config.fast_mode:
+            targets, results = self._probe_targets(targets, config)
+            if not targets:
+                return devices, [error for _, error, _ in results], ""
+
+        # SNMP is dominated by UDP wait, so concurrency scales with the target
+        # count unless explicitly configured
+        max_workers = config.max_concurrency or min(256, max(16, len(targets)))
+        process_count = min(
+            os.cpu_count() or 1, len(targets) // _MIN_TARGETS_PER_PROCESS
+        )
+        # An explicit max_concurrency caps in-flight requests across all
+        # processes, so never start more processes than it has slots
+        if config.max_concurrency:
+            process_count = min(process_count, config.max_concurrency)
 
-        # Use ThreadPoolExecutor for parallel scanning (limited concurrency for SNMP)
-        max_workers = min(5, len(targets))  # Limit SNMP concurrent requests
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all scan tasks
-            future_to_target = {
-                executor.submit(self._scan_single_target, target, config): target
-                for target in targets
-            }
+        if process_count > 1:
+            try:
+                results += self._scan_targets_in_processes(
+                    targets, config, process_count, max_workers
+                )
+            except (OSError, BrokenProcessPool) as e:
+                self._log_debug(
+                    f"SNMP process pool unavailable, scanning in-process: {str(e)}"
+                )
+                results += _run_async(
+                    self._async_scan_chunk(targets, config, max_workers)
+                )
+        else:
+            results += _run_async(self._async_scan_chunk(targets, config, max_workers))
 
-            # Collect results as they complete
-            for future in as_completed(future_to_target):
-                target = future_to_target[future]
-                try:
-                    device, error, raw_output = future.result()
-                    if device:
-                        devices.append(device)
-                    if error:
-                        errors.append(f"{target}: {error}")
-                    if raw_output:
-                        all_raw_output.append(
-                            f"=== SNMP Scan: {target} ===\n{raw_output}"
-                        )
-                except Exception as e:
-                    error_msg = f"Exception scanning {target}: {str(e)}"
-                    errors.append(error_msg)
-                    self._log_error(error_msg)
+        for device, error, raw_output in results:
+            if device:
+                devices.append(device)
+            if error:
+                errors.append(error)
+            if raw_output:
+                all_raw_output.append(raw_output)
 
         # Join all raw output with proper separation between devices
         formatted_raw_output = "\n\n".join(all_raw_output)
         return devices, errors, formatted_raw_output
 
-    def _scan_single_target(
-        self, target: str, config: SNMPConfig
+    def _probe_targets(
+        self, targets: List[str], config: SNMPConfig
+    ) -> Tuple[List[str], List[Tuple[Optional[DeviceInfo], Optional[str], str]]]:
+        """
+        Sweep all targets with raw SNMPv1/v2c GETs before the full scan.
+
+        Responding targets are seeded into the credential cache so their walk
+        starts with the community that answered. Silent targets are dropped
+        unless SNMPv3 is configured, since the probe cannot speak SNMPv3.
+
+        Args:
+            targets: List of IP addresses to scan
+            config: SNMP configuration
+
+        Returns:
+            Tuple of (targets still to scan, results for dropped targets)
+        """
+        try:
+            responders = probe_targets(
+                targets,
+                _credentials(config),
+                config.timeout,
+                config.retries,
+                logger=self.logger,
+            )
+        except OSError as e:
+            self._log_debug(f"SNMP fast probe failed, scanning all targets: {str(e)}")
+            return targets, []
+
+        for target, cred in responders.items():
+            if cred:
+                self._cred_cache[target] = cred
+
+        self._log_debug(
+            f"SNMP fast probe: {len(responders)} of {len(targets)} targets answered"
+        )
+        if 3 in config.versions:
+            return targets, []
+
+        silent = [
+            (None, f"{target}: No SNMP response from {target}", "")
+            for target in targets
+            if target not in responders
+        ]
+        return [target for target in targets if target in responders], silent
+
+    def _scan_targets_in_processes(
+        self,
+        targets: List[str],
+        config: SNMPConfig,
+        process_count: int,
+        max_concurrency: int,
+    ) -> List[Tuple[Optional[DeviceInfo], Optional[str], str]]:
+        """
+        Scan targets in chunks across a process pool.
+
+        The concurrency budget is a total across all workers: it is split so
+        the per-process shares add up to exactly max_concurrency, and no more
+        processes are started than the budget has slots.
+
+        Args:
+            targets: List of IP addresses to scan
+            config: SNMP configuration
+            process_count: Maximum number of worker processes
+            max_concurrency: Concurrent targets across all worker processes
+
+        Returns:
+            List of (device_info, error_message, raw_output) tuples
+        """
+        process_count = max(1, min(process_count, max_concurrency))
+        shares = _split_budget(max_concurrency, process_count)
+
+        # One chunk per process amortizes the IPC cost over many targets
+        chunks = [targets[i::process_count] for i in range(process_count)]
+        results = []
+
+        with ProcessPoolExecutor(max_workers=process_count) as executor:
+            futures = [
+                executor.submit(
+                    _scan_chunk,
+                    chunk,
+                    config,
+                    share,
+                    self.logger,
+                    {t: self._cred_cache[t] for t in chunk if t in self._cred_cache},
+                    dict(self._cred_hits),
+                    {
+                        t: self._engine_id_cache[t]
+                        for t in chunk
+                        if t in self._engine_id_cache
+                    },
+                )
+                for chunk, share in zip(chunks, shares)
+            ]
+            for future in as_completed(futures):
+                # Credentials and engine IDs learned by a worker are lost
+                # with its process unless they are merged back into this
+                # scanner
+                chunk_results, engine_ids, cred_cache, cred_hits = future.result()
+                results.extend(chunk_results)
+                self._engine_id_cache.update(engine_ids)
+                self._cred_cache.update(cred_cache)
+                self._cred_hits.update(cred_hits)
+
+        return results
+
+    async def _async_scan_chunk(
+        self, targets: List[str], config: SNMPConfig, max_concurrency: int
+    ) -> List[Tuple[Optional[DeviceInfo], Optional[str], str]]:
+        """
+        Scan a chunk of targets concurrently on the current event loop.
+
+        All targets share one SnmpEngine, so its dispatcher and MIB state are
+        built once per event loop instead of once per credential attempt.
+
+        Args:
+            targets: List of IP addresses to scan
+            config: SNMP configuration
+            max_concurrency: Initial number of targets scanned at once
+
+        Returns:
+            List of (device_info, error_message, raw_output) tuples
+        """
+        # An explicit max_concurrency is a hard cap; otherwise the limit may
+        # grow while devices keep answering
+        limiter = AdaptiveLimiter(
+            max_concurrency,
+            maximum=max_concurrency if config.max_concurrency else 512,
+        )
+
+        snmp_engine = SnmpEngine()
+        if 3 in config.versions:
+            self._share_engine_ids(snmp_engine, targets)
+
+        async def scan_with_limit(target: str):
+            async with limiter:
+                # Silence from a host that answered before is congestion;
+                # silence from any other host just means there is no agent
+                known = target in self._cred_cache
+                result = await self._async_scan_target(target, config, snmp_engine)
+                if result[0] is not None:
+                    limiter.record_success()
+                elif known:
+                    limiter.record_timeout()
+                return result
+
+        try:
+            results = await asyncio.gather(*(scan_with_limit(t) for t in targets))
+        finally:
+            snmp_engine.close_dispatcher()
+        self._log_debug(f"SNMP concurrency counters: {limiter.snapshot()}")
+        return results
+
+    def _share_engine_ids(self, snmp_engine: SnmpEngine, targets: List[str]) -> None:
+        """
+        Share known SNMPv3 engine IDs with a new SNMP engine and collect new ones.
+
+        pysnmp caches each agent's engine ID per SnmpEngine only, so every
+        scan would start with a discovery round-trip per target. IDs learned
+        by earlier scans are seeded into the engine's peer cache, and the
+        Report PDUs answering discovery (or a stale seeded ID) update both
+        this scanner's cache and the engine's.
+
+        Args:
+            snmp_engine: SNMP engine about to scan the targets
+            targets: IP addresses the engine will scan
+        """
+        peer_cache = _peer_engine_cache(snmp_engine)
+
+        def record_engine_id(snmp_engine, execpoint, variables, cb_ctx):
+            engine_id = variables["securityEngineId"]
+            if not engine_id:
+                return
+            address = variables["transportAddress"]
+            self._engine_id_cache[address[0]] = engine_id.asOctets()
+            if peer_cache is not None:
+                peer_cache[variables["transportDomain"], address] = {
+                    "securityEngineId": engine_id,
+                    "contextEngineId": variables["contextEngineId"],
+                    "contextName": variables["contextName"],
+                }
+
+        snmp_engine.observer.register_observer(
+            record_engine_id, "rfc3412.prepareDataElements:internal"
+        )
+
+        if peer_cache is None:
+            return
+        for target in targets:
+            engine_id = self._engine_id_cache.get(target)
+            if engine_id:
+                peer_cache[UdpTransportTarget.TRANSPORT_DOMAIN, (target, 161)] = {
+                    "securityEngineId": OctetString(engine_id),
+                    "contextEngineId": OctetString(engine_id),
+                    "contextName": OctetString(b""),
+                }
+
+    def _forget_engine_id(self, snmp_engine: SnmpEngine, target: str) -> None:
+        """
+        Drop the known SNMPv3 engine ID of a target.
+
+        Args:
+            snmp_engine: SNMP engine scanning the target
+            target: IP address of the target
+        """
+        self._engine_id_cache.pop(target, None)
+        peer_cache = _peer_engine_cache(snmp_engine)
+        if peer_cache is not None:
+            peer_cache.pop((UdpTransportTarget.TRANSPORT_DOMAIN, (target, 161)), None)
+
+    async def _async_scan_target(
+        self, target: str, config: SNMPConfig, snmp_engine: SnmpEngine
+    ) -> Tuple[Optional[DeviceInfo], Optional[str], str]:
+        """
+        Scan a single target and format its error and raw output for reporting.
+
+        Args:
+            target: IP address to scan
+            config: SNMP configuration
+            snmp_engine: Shared SNMP engine instance
+
+        Returns:
+            Tuple of (device_info, error_message, raw_output)
+        """
+        try:
+            device, error, raw_output = await self._async_scan_single_target(
+                target, config, snmp_engine
+            )
+        except Exception as e:
+            error_msg = f"Exception scanning {target}: {str(e)}"
+            self._log_error(error_msg)
+            return None, error_msg, ""
+
+        if error:
+            error = f"{target}: {error}"
+        if raw_output:
+            raw_output = f"=== SNMP Scan: {target} ===\n{raw_output}"
+        return device, error, raw_output
+
+    async def _async_scan_single_target(
+        self, target: str, config: SNMPConfig, snmp_engine: SnmpEngine
     ) -> Tuple[Optional[DeviceInfo], Optional[str], str]:
         """
         Perform SNMP scan on a single target.
 
+        A target without a known-good credential also gets one extra
+        GetRequest from a connected UDP socket, which is the only way to
+        receive the ICMP port unreachable that ends its credential loop
+        early. Targets known to answer skip that packet.
+
         Args:
             target: IP address to scan
             config: SNMP configuration
+            snmp_engine: Shared SNMP engine instance
 
         Returns:
             Tuple of (device_info, error_message, raw_output)
         """
-        # Try different SNMP versions and communities
-        for version in config.versions:
-            for community in config.communities:
-                try:
-                    # Run async SNMP walk in sync context
-                    snmp_data, raw_output = asyncio.run(
-                        self._async_snmp_walk(target, community, version, config)
-                    )
+        # Transport and context are shared by every credential attempt
+        try:
+            transport_target = await _create_transport(target, config)
+        except Exception as e:
+            return None, f"SNMP transport setup failed for {target}: {str(e)}", ""
+        context_data = ContextData()
+        credentials = self._credential_order(target, config)
 
-                    if snmp_data:
-                        # Create DeviceInfo with SNMP data
-                        device = DeviceInfo(
-                            ip_address=target,
-                            device_type=DeviceType.UNKNOWN,  # Will be classified by DeviceClassifier
-                            snmp_data=snmp_data,
-                        )
+        attempts = asyncio.ensure_future(
+            self._async_try_credentials(
+                snmp_engine, transport_target, context_data, target, credentials, config
+            )
+        )
 
-                        # Extract additional info from SNMP data
-                        self._enrich_device_info(device, snmp_data)
+        # A host without an SNMP agent usually answers with ICMP port
+        # unreachable; stop trying credentials as soon as that arrives.
+        # Hosts that answered before have an agent, so they are not watched.
+        watcher = None
+        community_creds = [cred for cred in credentials if cred[0] in (1, 2)]
+        if community_creds and target not in self._cred_cache:
+            try:
+                watcher = await watch_port_unreachable(
+                    target, community_creds[0], attempts.cancel
+                )
+            except OSError as e:
+                self._log_debug(f"Cannot watch {target} for ICMP errors: {str(e)}")
 
-                        self._log_info(
-                            f"SNMP scan successful for {target} (v{version}, {len(snmp_data)} OIDs)"
-                        )
-                        return device, None, raw_output
+        try:
+            return await attempts
+        except asyncio.CancelledError:
+            if watcher is None or not watcher[1].unreachable:
+                raise
+            return None, f"No SNMP agent on {target} (ICMP port unreachable)", ""
+        finally:
+            if watcher is not None:
+                watcher[0].close()
+
+    async def _async_try_credentials(
+        self,
+        snmp_engine: SnmpEngine,
+        transport_target: UdpTransportTarget,
+        context_data: ContextData,
+        target: str,
+        credentials: List[Tuple[int, str]],
+        config: SNMPConfig,
+    ) -> Tuple[Optional[DeviceInfo], Optional[str], str]:
+        """
+        Try (version, community) pairs in order until one returns data.
 
-                except Exception as e:
-                    self._log_debug(
-                        f"SNMP v{version}/{community} failed for {target}: {str(e)}"
+        Args:
+            snmp_engine: Shared SNMP engine instance
+            transport_target: UDP transport target for this target
+            context_data: SNMP context data
+            target: IP address to scan
+            credentials: (version, community) pairs in the order to try
+            config: SNMP configuration
+
+        Returns:
+            Tuple of (device_info, error_message, raw_output)
+        """
+        for version, community in credentials:
+            try:
+                snmp_data, raw_output = await self._async_snmp_walk(
+                    snmp_engine,
+                    transport_target,
+                    context_data,
+                    target,
+                    community,
+                    version,
+                    config,
+                )
+
+                if snmp_data:
+                    # Create DeviceInfo with SNMP data
+                    device = DeviceInfo(
+                        ip_address=target,
+                        device_type=DeviceType.UNKNOWN,  # Will be classified by DeviceClassifier
+                        snmp_data=snmp_data,
                     )
-                    continue
+
+                    # Extract additional info from SNMP data
+                    self._enrich_device_info(device, snmp_data)
+
+                    self._cred_cache[target] = (version, community)
+                    self._cred_hits[version, community] += 1
+
+                    self._log_info(
+                        f"SNMP scan successful for {target} (v{version}, {len(snmp_data)} OIDs)"
+                    )
+                    return device, None, raw_output
+
+                if version == 3:
+                    # Some agents silently drop requests for a stale engine
+                    # ID; rediscover it for the next attempt
+                    self._forget_engine_id(snmp_engine, target)
+
+            except Exception as e:
+                self._log_debug(
+                    f"SNMP v{version}/{community} failed for {target}: {str(e)}"
+                )
+                continue
 
         # No successful SNMP connection
         error_msg = f"No SNMP response from {target}"
         return None, error_msg, ""
 
+    def _credential_order(
+        self, target: str, config: SNMPConfig
+    ) -> List[Tuple[int, str]]:
+        """
+        Order the (version, community or user name) pairs to try for a target.
+
+        The pair that last worked for this target comes first, followed by
+        the remaining pairs ranked by how often they succeeded during this
+        scanner's lifetime. Ties keep the configured order.
+
+        Args:
+            target: IP address to scan
+            config: SNMP configuration
+
+        Returns:
+            List of (version, community) pairs
+        """
+        candidates = _credentials(config)
+        cached = self._cred_cache.get(target)
+        hits = self._cred_hits
+
+        if hits:
+            candidates.sort(key=lambda cred: -hits.get(cred, 0))
+        if cached in candidates:
+            candidates.remove(cached)
+            candidates.insert(0, cached)
+        return candidates
+
     async def _async_snmp_walk(
         self,
+        snmp_engine: SnmpEngine,
+        transport_target: UdpTransportTarget,
+        context_data: ContextData,
         target: str,
         community: str,
         version: int,
@@ -255,6 +887,9 @@ class SNMPScanner(BaseScanner):
         Perform async SNMP walk using pysnmp 7.x async API.
 
         Args:
+            snmp_engine: Shared SNMP engine instance
+            transport_target: UDP transport target for this target
+            context_data: SNMP context data
             target: Target IP address
             community: SNMP community string
             version: SNMP version (1, 2, or 3)
@@ -265,57 +900,56 @@ class SNMPScanner(BaseScanner):
         """
         snmp_data = {}
         raw_output_lines = []
+        capture_raw = config.capture_raw
 
         try:
             # Configure SNMP version and authentication
-            auth_data = self._create_auth_data(community, version)
-
-            # Create transport target using .create() method for pysnmp 7.x
-            transport_target = await UdpTransportTarget.create(
-                (target, 161), timeout=config.timeout, retries=config.retries
-            )
+            auth_data = self._create_auth_data(community, version, config)
 
-            context_data = ContextData()
-            snmp_engine = SnmpEngine()
-            try:
-                # Walk each configured OID
-                for base_oid in config.walk_oids:
-                    try:
-                        oid_data = await self._async_walk_oid(
-                            snmp_engine,
-                            auth_data,
-                            transport_target,
-                            context_data,
-                            base_oid,
-                            config,
-                        )
-                        snmp_data |= oid_data
+            # Walk each configured OID
+            for base_oid in config.walk_oids:
+                try:
+                    oid_data = await self._async_walk_oid(
+                        snmp_engine,
+                        auth_data,
+                        transport_target,
+                        context_data,
+                        base_oid,
+                        version,
+                        config,
+                    )
+                    snmp_data.update(oid_data)
 
-                        # Add to raw output with proper formatting
+                    # Add to raw output with proper formatting
+                    if capture_raw:
                         raw_output_lines.append(f"OID Walk: {base_oid}")
                         for oid, value in oid_data.items():
                             raw_output_lines.append(f"  {oid} = {value}")
 
-                    except Exception as e:
-                        error_msg = f"Error walking OID {base_oid}: {str(e)}"
-                        self._log_debug(error_msg)
+                except RequestTimedOut:
+                    raise
+                except Exception as e:
+                    error_msg = f"Error walking OID {base_oid}: {str(e)}"
+                    self._log_debug(error_msg)
+                    if capture_raw:
                         raw_output_lines.append(
                             f"OID Walk: {base_oid} - ERROR: {error_msg}"
                         )
 
-                # Query specific OIDs
-                if config.specific_oids:
-                    raw_output_lines.append("Specific OID Queries:")
-                    specific_data = await self._async_query_specific_oids(
-                        snmp_engine,
-                        auth_data,
-                        transport_target,
-                        context_data,
-                        config.specific_oids,
-                        config,
-                    )
+            # Query specific OIDs
+            if config.specific_oids:
+                specific_data = await self._async_query_specific_oids(
+                    snmp_engine,
+                    auth_data,
+                    transport_target,
+                    context_data,
+                    config.specific_oids,
+                    config,
+                )
 
-                    # Format output for specific OIDs
+                # Format output for specific OIDs
+                if capture_raw:
+                    raw_output_lines.append("Specific OID Queries:")
                     for oid_info in config.specific_oids:
                         oid = oid_info.get("oid")
                         name = oid_info.get("name", oid)
@@ -334,27 +968,28 @@ class SNMPScanner(BaseScanner):
                                 f"  {name} ({oid}) = {value} (from walk)"
                             )
 
-                    snmp_data |= specific_data
-
-            finally:
-                snmp_engine.close_dispatcher()
+                snmp_data.update(specific_data)
 
         except Exception as e:
             error_msg = f"SNMP walk failed for {target}: {str(e)}"
             self._log_debug(error_msg)
-            raw_output_lines.append(f"Error: {error_msg}")
+            if capture_raw:
+                raw_output_lines.append(f"Error: {error_msg}")
 
         # Join all output lines with proper line breaks
         formatted_output = "\n".join(raw_output_lines)
         return snmp_data, formatted_output
 
-    def _create_auth_data(self, community: str, version: int) -> Any:
+    def _create_auth_data(
+        self, community: str, version: int, config: SNMPConfig
+    ) -> Any:
         """
         Create authentication data based on SNMP version.
 
         Args:
             community: SNMP community string or username for v3
             version: SNMP version (1, 2, or 3)
+            config: SNMP configuration
 
         Returns:
             Authentication data object
@@ -364,13 +999,24 @@ class SNMPScanner(BaseScanner):
         elif version == 2:
             return CommunityData(community, mpModel=1)  # SNMPv2c
         elif version == 3:
-            # SNMPv3 - simplified implementation (noAuthNoPriv)
+            user = next(
+                (u for u in config.snmpv3_users if u["username"] == community), None
+            )
+            if user is None:
+                # No SNMPv3 users configured: community as noAuthNoPriv user
+                return UsmUserData(
+                    userName=community,
+                    authKey=None,
+                    privKey=None,
+                    authProtocol=usmNoAuthProtocol,
+                    privProtocol=usmNoPrivProtocol,
+                )
             return UsmUserData(
                 userName=community,
-                authKey=None,
-                privKey=None,
-                authProtocol=usmNoAuthProtocol,
-                privProtocol=usmNoPrivProtocol,
+                authKey=user["auth_key"],
+                privKey=user["priv_key"],
+                authProtocol=_USM_AUTH_PROTOCOLS[user["auth_protocol"]],
+                privProtocol=_USM_PRIV_PROTOCOLS[user["priv_protocol"]],
             )
         else:
             raise ValueError(f"Unsupported SNMP version: {version}")
@@ -382,42 +1028,67 @@ class SNMPScanner(BaseScanner):
         transport_target: UdpTransportTarget,
         context_data: ContextData,
         base_oid: str,
+        version: int,
         config: SNMPConfig,
     ) -> Dict[str, str]:
         """
         Walk a specific OID tree using async API.
 
+        SNMPv2c/v3 walks use GetBulk so each response carries up to
+        config.max_repetitions varbinds; SNMPv1 has no GetBulk and falls
+        back to GetNext. Both iterators stop at the end of the subtree.
+
         Args:
             snmp_engine: SNMP engine instance
             auth_data: Authentication data (community or USM)
             transport_target: UDP transport target
             context_data: SNMP context data
             base_oid: Base OID to walk
+            version: SNMP version (1, 2, or 3)
             config: SNMP configuration
 
         Returns:
             Dictionary of OID-value pairs
         """
-        oid_data = {}
+        # Rows are kept as (OID tuple, value); dotted keys are built once
+        rows = []
+        max_walk_oids = config.max_walk_oids
 
         try:
             # Create async iterator for SNMP walk
-            iterator = walk_cmd(
-                snmp_engine,
-                auth_data,
-                transport_target,
-                context_data,
-                ObjectType(ObjectIdentity(base_oid)),
-                lookupMib=False,
-                lexicographicMode=False,  # Stop at end of subtree
-                ignoreNonIncreasingOid=True,
-            )
+            if version == 1:
+                iterator = walk_cmd(
+                    snmp_engine,
+                    auth_data,
+                    transport_target,
+                    context_data,
+                    _object_type(base_oid),
+                    lookupMib=False,
+                    lexicographicMode=False,  # Stop at end of subtree
+                    ignoreNonIncreasingOid=True,
+                )
+            else:
+                iterator = bulk_walk_cmd(
+                    snmp_engine,
+                    auth_data,
+                    transport_target,
+                    context_data,
+                    0,
+                    config.max_repetitions,
+                    _object_type(base_oid),
+                    lookupMib=False,
+                    lexicographicMode=False,  # Stop at end of subtree
+                    ignoreNonIncreasingOid=True,
+                )
 
             # Iterate through results
             async for errorIndication, errorStatus, errorIndex, varBinds in iterator:
                 # Check for errors
                 if errorIndication:
                     self._log_debug(f"SNMP error indication: {errorIndication}")
+                    if isinstance(errorIndication, RequestTimedOut):
+                        # No point walking further OIDs with these credentials
+                        raise errorIndication
                     break
 
                 if errorStatus:
@@ -431,29 +1102,23 @@ class SNMPScanner(BaseScanner):
 
                 # Process variable bindings
                 for name, value in varBinds:
-                    oid_str = name.prettyPrint()
-                    value_str = value.prettyPrint()
-
-                    # Stop if we've walked beyond the base OID
-                    if not oid_str.startswith(base_oid):
-                        break
-
-                    oid_data[oid_str] = value_str
+                    rows.append((name.asTuple(), value.prettyPrint()))
 
                     # Limit the number of OIDs to prevent excessive data (configurable)
-                    max_walk_oids = getattr(config, "max_walk_oids", 1000)
-                    if len(oid_data) >= max_walk_oids:
+                    if len(rows) >= max_walk_oids:
                         self._log_debug(
                             f"Reached OID limit ({max_walk_oids}) for base OID {base_oid}"
                         )
-                        return oid_data
+                        return {_oid_to_str(oid): value for oid, value in rows}
 
+        except RequestTimedOut:
+            raise
         except PySnmpError as e:
             self._log_debug(f"PySnmp error walking {base_oid}: {str(e)}")
         except Exception as e:
             self._log_debug(f"Unexpected error walking {base_oid}: {str(e)}")
 
-        return oid_data
+        return {_oid_to_str(oid): value for oid, value in rows}
 
     async def _async_query_specific_oids(
         self,
@@ -499,7 +1164,7 @@ class SNMPScanner(BaseScanner):
                         auth_data,
                         transport_target,
                         context_data,
-                        ObjectType(ObjectIdentity(oid)),
+                        _object_type(oid),
                         lookupMib=False,
                     ),
                     timeout=5.0,
@@ -507,18 +1172,25 @@ class SNMPScanner(BaseScanner):
 
                 errorIndication, errorStatus, errorIndex, varBinds = result
 
+                if isinstance(errorIndication, RequestTimedOut):
+                    # The remaining GETs would time out the same way
+                    break
                 if errorIndication or errorStatus:
                     continue
 
-                # Process successful response
+                # Process successful response, skipping missing OIDs before
+                # anything is stringified
                 for var_name, var_value in varBinds:
-                    oid_str = var_name.prettyPrint()
-                    value_str = var_value.prettyPrint()
+                    if isinstance(var_value, (NoSuchObject, NoSuchInstance)):
+                        continue
 
-                    if value_str and not value_str.startswith("No Such"):
-                        oid_data[oid_str] = value_str
+                    value_str = var_value.prettyPrint()
+                    if value_str:
+                        oid_data[_oid_to_str(var_name.asTuple())] = value_str
 
-            except (asyncio.TimeoutError, Exception):
+            except asyncio.TimeoutError:
+                break
+            except Exception:
                 continue
 
         return oid_data
@@ -533,104 +1205,45 @@ class SNMPScanner(BaseScanner):
             device: DeviceInfo object to enrich
             snmp_data: SNMP OID-value pairs
         """
-        # Extract system description for OS info
-        for oid, value in snmp_data.items():
-            if oid == "1.3.6.1.2.1.1.1.0":  # sysDescr
-                device.os_info = value
-            elif oid == "1.3.6.1.2.1.1.5.0":  # sysName
-                device.hostname = value
-
-        # Extract manufacturer info
-        device.manufacturer = self._extract_manufacturer_from_snmp(snmp_data)
-
-    def _extract_manufacturer_from_snmp(
-        self, snmp_data: Dict[str, str]
-    ) -> Optional[str]:
-        """
-        Extract manufacturer information from SNMP data.
-
-        Args:
-            snmp_data: SNMP OID-value pairs
-
-        Returns:
-            Manufacturer name or None
-        """
-        # Get system description (most informative OID)
-        if sys_descr := snmp_data.get("1.3.6.1.2.1.1.1.0", ""):
-            # Common manufacturer patterns in system descriptions
-            manufacturers = {
-                "cisco": ["Cisco", "IOS"],
-                "hp": ["HP", "Hewlett", "Packard"],
-                "dell": ["Dell"],
-                "juniper": ["Juniper", "JUNOS"],
-                "netgear": ["NETGEAR", "Netgear"],
-                "linksys": ["Linksys"],
-                "dlink": ["D-Link", "DLink"],
-                "tplink": ["TP-Link", "TP-LINK"],
-                "ubiquiti": ["Ubiquiti", "UniFi"],
-                "mikrotik": ["MikroTik", "RouterOS"],
-                "fortinet": ["Fortinet", "FortiGate"],
-                "paloalto": ["Palo Alto", "PAN-OS"],
-                "aruba": ["Aruba"],
-                "extreme": ["Extreme", "ExtremeXOS"],
-            }
-
-            sys_descr_lower = sys_descr.lower()
-
-            for manufacturer, patterns in manufacturers.items():
-                for pattern in patterns:
-                    if pattern.lower() in sys_descr_lower:
-                        return manufacturer.title()
-
-        return None
+        # Look up the system OIDs directly rather than scanning all of snmp_data
+        sys_descr = snmp_data.get("1.3.6.1.2.1.1.1.0")
+        if sys_descr is not None:
+            device.os_info = sys_descr
+        sys_name = snmp_data.get("1.3.6.1.2.1.1.5.0")
+        if sys_name is not None:
+            device.hostname = sys_name
+
+        # Extract manufacturer info from the system description
+        device.manufacturer = (
+            match_manufacturer(sys_descr.lower()) if sys_descr else None
+        )
 
     def parse_results(self, raw_output: str) -> List[DeviceInfo]:
         """
         Parse raw SNMP scanner output into DeviceInfo objects.
 
         Args:
-            raw_output: Raw output from SNMP scanning
+            raw_output: Raw output from SNMP scanning (None unless the scan
+                ran with capture_raw enabled)
 
         Returns:
             List of DeviceInfo objects
         """
         devices = []
-
-        # Split by device sections
-        sections = raw_output.split("=== SNMP Scan: ")
-
-        for section in sections[1:]:  # Skip first empty section
-            if not section.strip():
-                continue
-
-            lines = section.split("\n")
-            if not lines:
-                continue
-
-            # Extract IP address from section header
-            header = lines[0].strip()
-            if header.endswith(" ==="):
-                ip_address = header.replace(" ===", "").strip()
-            else:
-                # If no closing ===, assume the whole header is the IP
-                ip_address = header.strip()
-
-            # Parse SNMP data from the section
-            snmp_data = {}
-            current_oid_base = None
-
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-
-                if line.strip().startswith("OID Walk:"):
-                    current_oid_base = line.replace("OID Walk:", "").strip()
-                elif line.startswith("  ") and " = " in line:
-                    # Parse OID-value pair
-                    oid_value = line.strip()
-                    if " = " in oid_value:
-                        oid, value = oid_value.split(" = ", 1)
-                        snmp_data[oid] = value
+        if not raw_output:
+            return devices
+
+        sections = list(_SECTION_RE.finditer(raw_output))
+        for index, section in enumerate(sections):
+            ip_address = section.group(1)
+
+            # Section body runs up to the next header (or end of output)
+            body_end = (
+                sections[index + 1].start()
+                if index + 1 < len(sections)
+                else len(raw_output)
+            )
+            snmp_data = dict(_KV_RE.findall(raw_output, section.end(), body_end))
 
             if snmp_data:
                 device = DeviceInfo(
@@ -656,16 +1269,77 @@ class SNMPScanner(BaseScanner):
         if not super()._is_valid_target(target):
             return False
 
-        # SNMP scanner only works with IP addresses
-        parts = target.strip().split(".")
-        if len(parts) != 4:
-            return False
-
+        # SNMP scanner only works with IP addresses. inet_pton only accepts
+        # strict dotted quads, unlike inet_aton ("10.1", "0x7f.0.0.1")
         try:
-            for part in parts:
-                num = int(part)
-                if not 0 <= num <= 255:
-                    return False
-            return True
-        except ValueError:
+            socket.inet_pton(socket.AF_INET, target.strip())
+        except OSError:
             return False
+
+        return True
+
+
+def _split_budget(total: int, parts: int) -> List[int]:
+    """
+    Split a concurrency budget into per-worker shares.
+
+    Args:
+        total: Total concurrency budget
+        parts: Number of workers sharing the budget
+
+    Returns:
+        List of shares that add up to exactly total
+    """
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def _scan_chunk(
+    targets: List[str],
+    config: SNMPConfig,
+    max_concurrency: int,
+    logger: Optional[Logger] = None,
+    cred_cache: Optional[Dict[str, Tuple[int, str]]] = None,
+    cred_hits: Optional[Dict[Tuple[int, str], int]] = None,
+    engine_ids: Optional[Dict[str, bytes]] = None,
+) -> Tuple[
+    List[Tuple[Optional[DeviceInfo], Optional[str], str]],
+    Dict[str, bytes],
+    Dict[str, Tuple[int, str]],
+    Counter,
+]:
+    """
+    Scan a chunk of targets inside a worker process.
+
+    Module-level so it can be pickled by ProcessPoolExecutor; each worker
+    runs its own event loop over the whole chunk. The engine IDs and
+    credentials it learns are returned so the parent scanner can merge them.
+
+    Args:
+        targets: List of IP addresses assigned to this worker
+        config: SNMP configuration
+        max_concurrency: Maximum number of targets scanned at once
+        logger: Logger instance for the worker (optional)
+        cred_cache: Known-good (version, community) per target (optional)
+        cred_hits: Success count per (version, community) so far (optional)
+        engine_ids: Known SNMPv3 engine ID per target (optional)
+
+    Returns:
+        Tuple of (device_info, error_message, raw_output) tuples, the
+        worker's engine ID cache, its credential cache and the success
+        counts added by it
+    """
+    scanner = SNMPScanner(logger)
+    seeded_hits = Counter(cred_hits or {})
+    if cred_cache:
+        scanner._cred_cache.update(cred_cache)
+    scanner._cred_hits.update(seeded_hits)
+    if engine_ids:
+        scanner._engine_id_cache.update(engine_ids)
+    results = _run_async(scanner._async_scan_chunk(targets, config, max_concurrency))
+    return (
+        results,
+        scanner._engine_id_cache,
+        scanner._cred_cache,
+        scanner._cred_hits - seeded_hits,
+    )
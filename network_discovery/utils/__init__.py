@@ -1,20 +1,56 @@
 """
 Utility functions and helper classes.
+
+Only the logger is imported eagerly; the remaining helpers are loaded on
+first access (PEP 562) so importing a single utility does not pull in the
+whole package.
 """
 
+import importlib
+
 from .logger import Logger, LogLevel, logger, set_log_level, get_logger
-from .json_reporter import JSONReporter
-from .error_handler import (
-    ErrorHandler, ToolValidator, ErrorContext, ErrorType, ErrorSeverity,
-    NetworkDiscoveryError, NetworkError, PermissionError, ToolMissingError,
-    ConfigurationError, ValidationError, with_retry
-)
-from .network_validator import NetworkValidator, NetworkValidationResult, validate_scan_targets
-from . import network_utils
+
+# Lazily loaded attribute -> submodule that defines it
+_LAZY = {
+    'JSONReporter': '.json_reporter',
+    'ErrorHandler': '.error_handler',
+    'ToolValidator': '.error_handler',
+    'ErrorContext': '.error_handler',
+    'ErrorType': '.error_handler',
+    'ErrorSeverity': '.error_handler',
+    'NetworkDiscoveryError': '.error_handler',
+    'NetworkError': '.error_handler',
+    'PermissionError': '.error_handler',
+    'ToolMissingError': '.error_handler',
+    'ConfigurationError': '.error_handler',
+    'ValidationError': '.error_handler',
+    'with_retry': '.error_handler',
+    'NetworkValidator': '.network_validator',
+    'NetworkValidationResult': '.network_validator',
+    'validate_scan_targets': '.network_validator',
+}
+
+_LAZY_MODULES = {'network_utils'}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'Logger',
-    'LogLevel', 
+    'LogLevel',
     'logger',
     'set_log_level',
     'get_logger',
@@ -35,4 +71,4 @@ __all__ = [
     'NetworkValidationResult',
     'validate_scan_targets',
     'network_utils'
-]
\ No newline at end of file
+]
@@ -6,23 +6,31 @@ permission error detection, external tool validation, and user-friendly error me
 with troubleshooting suggestions.
 """
 
+import asyncio
 import time
-import random
 import subprocess
 import shutil
 import os
+import re
 import socket
 import errno
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from random import random as _rand
 from typing import Optional, Callable, Any, Dict, List, Tuple
-from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
-from .logger import Logger, get_logger
+from .logger import Logger, LogLevel, get_logger
 
 
-class ErrorType(Enum):
-    """Enumeration for different types of errors."""
+class ErrorType:
+    """
+    Error type constants.
+    
+    Plain string constants rather than an Enum: they are only used as dict
+    keys and in comparisons, where str hashing and equality are cheaper.
+    """
     NETWORK_ERROR = "network_error"
     PERMISSION_ERROR = "permission_error"
     TOOL_MISSING_ERROR = "tool_missing_error"
@@ -31,14 +39,27 @@ class ErrorType(Enum):
     TIMEOUT_ERROR = "timeout_error"
     SUBPROCESS_ERROR = "subprocess_error"
     FILE_ERROR = "file_error"
+    
+    _ALL = (
+        NETWORK_ERROR,
+        PERMISSION_ERROR,
+        TOOL_MISSING_ERROR,
+        CONFIGURATION_ERROR,
+        VALIDATION_ERROR,
+        TIMEOUT_ERROR,
+        SUBPROCESS_ERROR,
+        FILE_ERROR,
+    )
 
 
-class ErrorSeverity(Enum):
-    """Enumeration for error severity levels."""
+class ErrorSeverity:
+    """Error severity level constants (plain strings, see ErrorType)."""
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
+    
+    _ALL = (LOW, MEDIUM, HIGH, CRITICAL)
 
 
 @dataclass
@@ -55,19 +76,52 @@ class ErrorContext:
         max_retries: Maximum number of retries allowed
         additional_info: Additional context information
     """
-    error_type: ErrorType
-    severity: ErrorSeverity
+    error_type: str  # ErrorType constant
+    severity: str  # ErrorSeverity constant
     operation: str
     component: str
     retry_count: int = 0
     max_retries: int = 3
-    additional_info: Dict[str, Any] = None
+    additional_info: Dict[str, Any] = field(default_factory=dict)
     
     def __post_init__(self):
         if self.additional_info is None:
             self.additional_info = {}
 
 
+# Exponential backoff delays in seconds, shared by all handlers
+_RETRY_DELAYS = (1, 2, 4, 8, 16)
+
+# Zeroed error statistics, copied by each handler
+_EMPTY_STATS = dict.fromkeys(ErrorType._ALL, 0)
+
+# Subprocess return codes for transient issues that might benefit from retry
+# (timeout, not found, permission, interrupted)
+_TRANSIENT_SUBPROCESS_CODES = frozenset({124, 125, 126, 127, 130, 143})
+
+# Words in a tool's stderr that indicate missing privileges
+_PERMISSION_RE = re.compile(
+    r"permission|privilege|root|sudo|access denied", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=None)
+def _which_cached(tool_name: str) -> Optional[str]:
+    """
+    Locate a tool in PATH, remembering the answer for the process lifetime.
+    
+    shutil.which() stats every PATH entry on each call; use
+    _which_cached.cache_clear() after installing tools or changing PATH.
+    
+    Args:
+        tool_name: Name of the executable
+        
+    Returns:
+        Full path to the tool, or None if it is not in PATH
+    """
+    return shutil.which(tool_name)
+
+
 class NetworkDiscoveryError(Exception):
     """Base exception class for Network Discovery Module."""
     
@@ -117,17 +171,35 @@ class ErrorHandler:
             logger: Logger instance for error reporting
         """
         self.logger = logger or get_logger(__name__)
-        self.error_statistics: Dict[ErrorType, int] = {}
-        self.retry_delays = [1, 2, 4, 8, 16]  # Exponential backoff delays in seconds
+        self.error_statistics: Dict[str, int] = _EMPTY_STATS.copy()
+        self.retry_delays = _RETRY_DELAYS
+        
+        # Handler for each error type, looked up once per error
+        self._dispatch: Dict[str, Callable[[Exception, ErrorContext], Tuple[bool, float]]] = {
+            ErrorType.NETWORK_ERROR: self._handle_network_error,
+            ErrorType.PERMISSION_ERROR: self._handle_permission_error,
+            ErrorType.TOOL_MISSING_ERROR: self._handle_tool_missing_error,
+            ErrorType.CONFIGURATION_ERROR: self._handle_configuration_error,
+            ErrorType.VALIDATION_ERROR: self._handle_validation_error,
+            ErrorType.TIMEOUT_ERROR: self._handle_timeout_error,
+            ErrorType.SUBPROCESS_ERROR: self._handle_subprocess_error,
+            ErrorType.FILE_ERROR: self._handle_file_error,
+        }
         
-        # Initialize error statistics
-        for error_type in ErrorType:
-            self.error_statistics[error_type] = 0
+        # Log call for each severity; unknown severities log at debug level
+        self._log_dispatch: Dict[str, Callable[[str, Exception], None]] = {
+            ErrorSeverity.CRITICAL: lambda msg, error: self.logger.error(msg, exception=error),
+            ErrorSeverity.HIGH: lambda msg, error: self.logger.error(msg),
+            ErrorSeverity.MEDIUM: lambda msg, error: self.logger.warning(msg),
+        }
     
     def handle_error(self, error: Exception, context: ErrorContext) -> bool:
         """
         Handle an error based on its type and context.
         
+        Blocks for the retry delay before returning True; coroutines should
+        use handle_error_async instead.
+        
         Args:
             error: The exception that occurred
             context: Error context information
@@ -135,6 +207,38 @@ class ErrorHandler:
         Returns:
             bool: True if error was handled and operation should retry, False otherwise
         """
+        should_retry, delay = self._compute_retry_decision(error, context)
+        if should_retry and delay:
+            time.sleep(delay)
+        return should_retry
+    
+    async def handle_error_async(self, error: Exception, context: ErrorContext) -> bool:
+        """
+        Handle an error like handle_error, without blocking the event loop.
+        
+        Args:
+            error: The exception that occurred
+            context: Error context information
+            
+        Returns:
+            bool: True if error was handled and operation should retry, False otherwise
+        """
+        should_retry, delay = self._compute_retry_decision(error, context)
+        if should_retry and delay:
+            await asyncio.sleep(delay)
+        return should_retry
+    
+    def _compute_retry_decision(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
+        """
+        Record, log and classify an error without waiting.
+        
+        Args:
+            error: The exception that occurred
+            context: Error context information
+            
+        Returns:
+            Tuple of (should_retry, delay in seconds before retrying)
+        """
         # Update error statistics
         self.error_statistics[context.error_type] += 1
         
@@ -142,27 +246,13 @@ class ErrorHandler:
         self._log_error(error, context)
         
         # Handle specific error types
-        if context.error_type == ErrorType.NETWORK_ERROR:
-            return self._handle_network_error(error, context)
-        elif context.error_type == ErrorType.PERMISSION_ERROR:
-            return self._handle_permission_error(error, context)
-        elif context.error_type == ErrorType.TOOL_MISSING_ERROR:
-            return self._handle_tool_missing_error(error, context)
-        elif context.error_type == ErrorType.CONFIGURATION_ERROR:
-            return self._handle_configuration_error(error, context)
-        elif context.error_type == ErrorType.VALIDATION_ERROR:
-            return self._handle_validation_error(error, context)
-        elif context.error_type == ErrorType.TIMEOUT_ERROR:
-            return self._handle_timeout_error(error, context)
-        elif context.error_type == ErrorType.SUBPROCESS_ERROR:
-            return self._handle_subprocess_error(error, context)
-        elif context.error_type == ErrorType.FILE_ERROR:
-            return self._handle_file_error(error, context)
-        else:
+        handler = self._dispatch.get(context.error_type)
+        if handler is None:
             self.logger.error(f"Unknown error type: {context.error_type}")
-            return False
+            return False, 0.0
+        return handler(error, context)
     
-    def _handle_network_error(self, error: Exception, context: ErrorContext) -> bool:
+    def _handle_network_error(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
         """
         Handle network-related errors with retry logic and exponential backoff.
         
@@ -171,28 +261,28 @@ class ErrorHandler:
             context: Error context information
             
         Returns:
-            bool: True if should retry, False otherwise
+            Tuple[bool, float]: (should_retry, backoff delay in seconds)
         """
         if context.retry_count >= context.max_retries:
             self.logger.error(f"Network operation failed after {context.max_retries} retries")
-            self._suggest_network_troubleshooting(error, context)
-            return False
+            self._suggest("network", error, context)
+            return False, 0.0
         
-        # Calculate delay with exponential backoff and jitter
+        # Calculate delay with exponential backoff and jitter. Spreading the
+        # delay over the upper half of the backoff window keeps concurrent
+        # retries from converging while never retrying sooner than half of it
         delay_index = min(context.retry_count, len(self.retry_delays) - 1)
         base_delay = self.retry_delays[delay_index]
-        jitter = random.uniform(0.1, 0.5)  # Add jitter to prevent thundering herd
-        delay = base_delay + jitter
+        delay = base_delay * (0.5 + _rand() * 0.5)
         
         self.logger.warning(
             f"Network error in {context.operation} (attempt {context.retry_count + 1}/{context.max_retries + 1}). "
             f"Retrying in {delay:.1f} seconds..."
         )
         
-        time.sleep(delay)
-        return True
+        return True, delay
     
-    def _handle_permission_error(self, error: Exception, context: ErrorContext) -> bool:
+    def _handle_permission_error(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
         """
         Handle permission-related errors with helpful user guidance.
         
@@ -201,13 +291,13 @@ class ErrorHandler:
             context: Error context information
             
         Returns:
-            bool: False (permission errors typically don't benefit from retries)
+            Tuple[bool, float]: (False, 0.0) - permission errors typically don't benefit from retries
         """
         self.logger.error(f"Permission denied for {context.operation}")
-        self._suggest_permission_solutions(error, context)
-        return False
+        self._suggest("permission", error, context)
+        return False, 0.0
     
-    def _handle_tool_missing_error(self, error: Exception, context: ErrorContext) -> bool:
+    def _handle_tool_missing_error(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
         """
         Handle missing external tool errors.
         
@@ -216,14 +306,14 @@ class ErrorHandler:
             context: Error context information
             
         Returns:
-            bool: False (missing tools need to be installed)
+            Tuple[bool, float]: (False, 0.0) - missing tools need to be installed
         """
         tool_name = context.additional_info.get('tool_name', 'unknown')
         self.logger.error(f"Required tool '{tool_name}' is not available")
-        self._suggest_tool_installation(tool_name)
-        return False
+        self._suggest("tool", error, context)
+        return False, 0.0
     
-    def _handle_configuration_error(self, error: Exception, context: ErrorContext) -> bool:
+    def _handle_configuration_error(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
         """
         Handle configuration-related errors.
         
@@ -232,14 +322,14 @@ class ErrorHandler:
             context: Error context information
             
         Returns:
-            bool: False (configuration errors need manual intervention)
+            Tuple[bool, float]: (False, 0.0) - configuration errors need manual intervention
         """
         config_file = context.additional_info.get('config_file', 'unknown')
         self.logger.error(f"Configuration error in {config_file}")
-        self._suggest_configuration_fixes(error, context)
-        return False
+        self._suggest("config", error, context)
+        return False, 0.0
     
-    def _handle_validation_error(self, error: Exception, context: ErrorContext) -> bool:
+    def _handle_validation_error(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
         """
         Handle validation errors.
         
@@ -248,13 +338,13 @@ class ErrorHandler:
             context: Error context information
             
         Returns:
-            bool: False (validation errors need input correction)
+            Tuple[bool, float]: (False, 0.0) - validation errors need input correction
         """
         self.logger.error(f"Validation failed for {context.operation}")
-        self._suggest_validation_fixes(error, context)
-        return False
+        self._suggest("validation", error, context)
+        return False, 0.0
     
-    def _handle_timeout_error(self, error: Exception, context: ErrorContext) -> bool:
+    def _handle_timeout_error(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
         """
         Handle timeout errors with retry logic.
         
@@ -263,12 +353,12 @@ class ErrorHandler:
             context: Error context information
             
         Returns:
-            bool: True if should retry with longer timeout, False otherwise
+            Tuple[bool, float]: (should_retry, 0.0) - retries use a longer timeout instead of a delay
         """
         if context.retry_count >= context.max_retries:
             self.logger.error(f"Operation timed out after {context.max_retries} retries")
-            self._suggest_timeout_solutions(error, context)
-            return False
+            self._suggest("timeout", error, context)
+            return False, 0.0
         
         # Increase timeout for retry
         current_timeout = context.additional_info.get('timeout', 30)
@@ -280,9 +370,9 @@ class ErrorHandler:
             f"Retrying with increased timeout: {new_timeout}s"
         )
         
-        return True
+        return True, 0.0
     
-    def _handle_subprocess_error(self, error: Exception, context: ErrorContext) -> bool:
+    def _handle_subprocess_error(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
         """
         Handle subprocess execution errors.
         
@@ -291,29 +381,25 @@ class ErrorHandler:
             context: Error context information
             
         Returns:
-            bool: True if should retry for transient errors, False otherwise
+            Tuple[bool, float]: (should_retry, delay in seconds) - only transient errors are retried
         """
         if isinstance(error, subprocess.CalledProcessError):
             return_code = error.returncode
             
-            # Some return codes indicate transient issues that might benefit from retry
-            transient_codes = [124, 125, 126, 127, 130, 143]  # timeout, not found, permission, interrupted
-            
-            if return_code in transient_codes and context.retry_count < context.max_retries:
+            if return_code in _TRANSIENT_SUBPROCESS_CODES and context.retry_count < context.max_retries:
                 self.logger.warning(
                     f"Subprocess failed with code {return_code} (attempt {context.retry_count + 1}/{context.max_retries + 1}). "
                     "Retrying..."
                 )
-                time.sleep(2)  # Brief delay before retry
-                return True
+                return True, 2.0  # Brief delay before retry
             else:
                 self.logger.error(f"Subprocess failed with return code {return_code}")
-                self._suggest_subprocess_solutions(error, context)
-                return False
+                self._suggest("subprocess", error, context)
+                return False, 0.0
         
-        return False
+        return False, 0.0
     
-    def _handle_file_error(self, error: Exception, context: ErrorContext) -> bool:
+    def _handle_file_error(self, error: Exception, context: ErrorContext) -> Tuple[bool, float]:
         """
         Handle file system related errors.
         
@@ -322,12 +408,12 @@ class ErrorHandler:
             context: Error context information
             
         Returns:
-            bool: False (file errors typically need manual intervention)
+            Tuple[bool, float]: (False, 0.0) - file errors typically need manual intervention
         """
         file_path = context.additional_info.get('file_path', 'unknown')
         self.logger.error(f"File system error with {file_path}")
-        self._suggest_file_solutions(error, context)
-        return False
+        self._suggest("file", error, context)
+        return False, 0.0
     
     def _log_error(self, error: Exception, context: ErrorContext) -> None:
         """
@@ -337,114 +423,30 @@ class ErrorHandler:
             error: The exception that occurred
             context: Error context information
         """
+        log = self._log_dispatch.get(context.severity)
+        if log is None and not self.logger.is_enabled_for(LogLevel.DEBUG):
+            # Low severity errors are logged at debug level; skip formatting
+            return
+        
         error_msg = f"Error in {context.component}.{context.operation}: {str(error)}"
         
-        if context.severity == ErrorSeverity.CRITICAL:
-            self.logger.error(error_msg, exception=error)
-        elif context.severity == ErrorSeverity.HIGH:
-            self.logger.error(error_msg)
-        elif context.severity == ErrorSeverity.MEDIUM:
-            self.logger.warning(error_msg)
-        else:
+        if log is None:
             self.logger.debug(error_msg)
-    
-    def _suggest_network_troubleshooting(self, error: Exception, context: ErrorContext) -> None:
-        """Provide network troubleshooting suggestions."""
-        self.logger.info("Network troubleshooting suggestions:")
-        self.logger.info("  • Check network connectivity: ping 8.8.8.8")
-        self.logger.info("  • Verify DNS resolution: nslookup google.com")
-        self.logger.info("  • Check firewall settings")
-        self.logger.info("  • Ensure target network is reachable")
-        self.logger.info("  • Try running with elevated privileges")
-    
-    def _suggest_permission_solutions(self, error: Exception, context: ErrorContext) -> None:
-        """Provide permission error solutions."""
-        operation = context.operation
-        self.logger.info("Permission error solutions:")
-        
-        if "nmap" in operation.lower():
-            self.logger.info("  • Run with sudo: sudo python -m network_discovery")
-            self.logger.info("  • Use non-privileged scan types (-sT instead of -sS)")
-            self.logger.info("  • Configure nmap with appropriate capabilities")
-        elif "arp" in operation.lower():
-            self.logger.info("  • Run with sudo: sudo python -m network_discovery")
-            self.logger.info("  • Use scapy method instead of arping")
-            self.logger.info("  • Check network interface permissions")
         else:
-            self.logger.info("  • Run with elevated privileges (sudo)")
-            self.logger.info("  • Check file/directory permissions")
-            self.logger.info("  • Ensure user has necessary group memberships")
-    
-    def _suggest_tool_installation(self, tool_name: str) -> None:
-        """Provide tool installation suggestions."""
-        suggestions = {
-            "nmap": [
-                "Ubuntu/Debian: sudo apt-get install nmap",
-                "CentOS/RHEL: sudo yum install nmap",
-                "macOS: brew install nmap",
-                "Windows: Download from https://nmap.org/download.html"
-            ],
-            "arping": [
-                "Ubuntu/Debian: sudo apt-get install arping",
-                "CentOS/RHEL: sudo yum install arping", 
-                "macOS: brew install arping",
-                "Windows: Use Windows Subsystem for Linux (WSL)"
-            ],
-            "snmpwalk": [
-                "Ubuntu/Debian: sudo apt-get install snmp-utils",
-                "CentOS/RHEL: sudo yum install net-snmp-utils",
-                "macOS: brew install net-snmp",
-                "Windows: Download from http://www.net-snmp.org/"
-            ]
-        }
+            log(error_msg, error)
+    
+    def _suggest(self, category: str, error: Exception, context: ErrorContext) -> None:
+        """
+        Log troubleshooting suggestions for an operation that failed for good.
         
-        if tool_name in suggestions:
-            self.logger.info(f"Installation suggestions for {tool_name}:")
-            for suggestion in suggestions[tool_name]:
-                self.logger.info(f"  • {suggestion}")
-        else:
-            self.logger.info(f"Please install {tool_name} using your system's package manager")
-    
-    def _suggest_configuration_fixes(self, error: Exception, context: ErrorContext) -> None:
-        """Provide configuration error solutions."""
-        self.logger.info("Configuration error solutions:")
-        self.logger.info("  • Check YAML syntax and indentation")
-        self.logger.info("  • Verify all required configuration keys are present")
-        self.logger.info("  • Ensure configuration values are valid")
-        self.logger.info("  • Check file permissions for configuration files")
-        self.logger.info("  • Use default configuration as reference")
-    
-    def _suggest_validation_fixes(self, error: Exception, context: ErrorContext) -> None:
-        """Provide validation error solutions."""
-        self.logger.info("Validation error solutions:")
-        self.logger.info("  • Check input format and syntax")
-        self.logger.info("  • Verify IP addresses are in correct format")
-        self.logger.info("  • Ensure network ranges are valid")
-        self.logger.info("  • Check that required parameters are provided")
-    
-    def _suggest_timeout_solutions(self, error: Exception, context: ErrorContext) -> None:
-        """Provide timeout error solutions."""
-        self.logger.info("Timeout error solutions:")
-        self.logger.info("  • Increase timeout values in configuration")
-        self.logger.info("  • Check network latency to target hosts")
-        self.logger.info("  • Reduce scan scope or parallelism")
-        self.logger.info("  • Verify target hosts are responsive")
-    
-    def _suggest_subprocess_solutions(self, error: Exception, context: ErrorContext) -> None:
-        """Provide subprocess error solutions."""
-        self.logger.info("Subprocess error solutions:")
-        self.logger.info("  • Verify external tools are properly installed")
-        self.logger.info("  • Check tool versions for compatibility")
-        self.logger.info("  • Ensure sufficient system resources")
-        self.logger.info("  • Review command-line arguments")
-    
-    def _suggest_file_solutions(self, error: Exception, context: ErrorContext) -> None:
-        """Provide file system error solutions."""
-        self.logger.info("File system error solutions:")
-        self.logger.info("  • Check file and directory permissions")
-        self.logger.info("  • Verify sufficient disk space")
-        self.logger.info("  • Ensure parent directories exist")
-        self.logger.info("  • Check for file locks or conflicts")
+        Args:
+            category: Suggestion category (see error_suggestions.emit)
+            error: The exception that occurred
+            context: Error context information
+        """
+        # Suggestion text is only needed on terminal failures; load it then
+        from .error_suggestions import emit
+        emit(category, self.logger, context, error)
 
 
 class ToolValidator:
@@ -455,6 +457,31 @@ class ToolValidator:
     availability checks, version verification, and permission testing.
     """
     
+    # Error context shapes per check; only the tool name varies per error
+    _CTX_AVAILABILITY = ErrorContext(
+        error_type=ErrorType.TOOL_MISSING_ERROR,
+        severity=ErrorSeverity.HIGH,
+        operation="tool_availability_check",
+        component="ToolValidator"
+    )
+    _CTX_VERSION = ErrorContext(
+        error_type=ErrorType.SUBPROCESS_ERROR,
+        severity=ErrorSeverity.MEDIUM,
+        operation="tool_version_check",
+        component="ToolValidator"
+    )
+    _CTX_PERMISSION = ErrorContext(
+        error_type=ErrorType.PERMISSION_ERROR,
+        severity=ErrorSeverity.HIGH,
+        operation="tool_permission_check",
+        component="ToolValidator"
+    )
+    _CTX_PERMISSION_SUBPROCESS = replace(
+        _CTX_PERMISSION,
+        error_type=ErrorType.SUBPROCESS_ERROR,
+        severity=ErrorSeverity.MEDIUM
+    )
+    
     def __init__(self, error_handler: ErrorHandler):
         """
         Initialize the ToolValidator.
@@ -487,22 +514,47 @@ class ToolValidator:
             }
         }
     
-    def validate_all_tools(self) -> Tuple[bool, List[str]]:
+    def validate_all_tools(self, fail_fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Validate all required external tools.
         
+        Tools are validated concurrently, since each check mostly waits on
+        subprocesses with multi-second timeouts.
+        
+        Args:
+            fail_fast: Stop collecting results at the first invalid tool;
+                missing_tools then holds only that tool. Checks that have
+                already started are still waited for, so none of them
+                records errors after this method returns
+        
         Returns:
             Tuple of (all_valid, missing_tools)
         """
-        missing_tools = []
-        all_valid = True
+        tool_names = list(self.tool_validations)
         
-        for tool_name in self.tool_validations.keys():
-            if not self.validate_tool(tool_name):
-                missing_tools.append(tool_name)
-                all_valid = False
+        if fail_fast:
+            # PATH lookups are cheap, so rule out missing tools before any
+            # subprocess is started
+            for tool_name in tool_names:
+                if not self._check_tool_availability(tool_name):
+                    return False, [tool_name]
         
-        return all_valid, missing_tools
+        executor = ThreadPoolExecutor(max_workers=len(tool_names))
+        futures = {executor.submit(self.validate_tool, name): name for name in tool_names}
+        invalid = set()
+        try:
+            for future in as_completed(futures):
+                if not future.result():
+                    invalid.add(futures[future])
+                    if fail_fast:
+                        break
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+        
+        missing_tools = [name for name in tool_names if name in invalid]
+        return not missing_tools, missing_tools
     
     def validate_tool(self, tool_name: str) -> bool:
         """
@@ -537,6 +589,20 @@ class ToolValidator:
         self.logger.debug(f"Tool {tool_name} validation passed")
         return True
     
+    @staticmethod
+    def _tool_context(template: ErrorContext, tool_name: str) -> ErrorContext:
+        """
+        Build an error context for a tool from one of the class templates.
+        
+        Args:
+            template: Error context template for the failed check
+            tool_name: Name of the tool being checked
+            
+        Returns:
+            ErrorContext: Copy of the template carrying the tool name
+        """
+        return replace(template, additional_info={"tool_name": tool_name})
+    
     def _check_tool_availability(self, tool_name: str) -> bool:
         """
         Check if a tool is available in the system PATH.
@@ -547,18 +613,12 @@ class ToolValidator:
         Returns:
             bool: True if tool is available, False otherwise
         """
-        tool_path = shutil.which(tool_name)
+        tool_path = _which_cached(tool_name)
         if tool_path:
             self.logger.debug(f"Found {tool_name} at: {tool_path}")
             return True
         else:
-            context = ErrorContext(
-                error_type=ErrorType.TOOL_MISSING_ERROR,
-                severity=ErrorSeverity.HIGH,
-                operation="tool_availability_check",
-                component="ToolValidator",
-                additional_info={"tool_name": tool_name}
-            )
+            context = self._tool_context(self._CTX_AVAILABILITY, tool_name)
             error = ToolMissingError(f"Tool {tool_name} not found in PATH")
             self.error_handler.handle_error(error, context)
             return False
@@ -575,17 +635,24 @@ class ToolValidator:
             bool: True if version is acceptable, False otherwise
         """
         try:
+            # The output is only used for debug logging, so don't capture
+            # and decode it unless it will be shown
+            log_output = self.logger.is_enabled_for(LogLevel.DEBUG)
+            if log_output:
+                output = {"capture_output": True, "text": True}
+            else:
+                output = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
             result = subprocess.run(
                 tool_config["check_command"],
-                capture_output=True,
-                text=True,
-                timeout=10
+                stdin=subprocess.DEVNULL,
+                timeout=10,
+                **output
             )
             
             if result.returncode == 0:
-                # Parse version from output (basic implementation)
-                version_output = result.stdout + result.stderr
-                self.logger.debug(f"{tool_name} version check output: {version_output[:100]}...")
+                if log_output:
+                    version_output = result.stdout + result.stderr
+                    self.logger.debug(f"{tool_name} version check output: {version_output[:100]}...")
                 return True  # Simplified - assume version is OK if command succeeds
             else:
                 self.logger.warning(f"{tool_name} version check failed with code {result.returncode}")
@@ -595,13 +662,7 @@ class ToolValidator:
             self.logger.warning(f"{tool_name} version check timed out")
             return False
         except Exception as e:
-            context = ErrorContext(
-                error_type=ErrorType.SUBPROCESS_ERROR,
-                severity=ErrorSeverity.MEDIUM,
-                operation="tool_version_check",
-                component="ToolValidator",
-                additional_info={"tool_name": tool_name}
-            )
+            context = self._tool_context(self._CTX_VERSION, tool_name)
             self.error_handler.handle_error(e, context)
             return False
     
@@ -631,16 +692,8 @@ class ToolValidator:
                 return True
             else:
                 # Check if error indicates permission issue
-                error_output = result.stderr.lower()
-                if any(perm_keyword in error_output for perm_keyword in 
-                       ["permission", "privilege", "root", "sudo", "access denied"]):
-                    context = ErrorContext(
-                        error_type=ErrorType.PERMISSION_ERROR,
-                        severity=ErrorSeverity.HIGH,
-                        operation="tool_permission_check",
-                        component="ToolValidator",
-                        additional_info={"tool_name": tool_name}
-                    )
+                if _PERMISSION_RE.search(result.stderr):
+                    context = self._tool_context(self._CTX_PERMISSION, tool_name)
                     error = PermissionError(f"Tool {tool_name} requires elevated permissions")
                     self.error_handler.handle_error(error, context)
                     return False
@@ -652,13 +705,7 @@ class ToolValidator:
             self.logger.warning(f"{tool_name} permission test timed out")
             return False
         except Exception as e:
-            context = ErrorContext(
-                error_type=ErrorType.SUBPROCESS_ERROR,
-                severity=ErrorSeverity.MEDIUM,
-                operation="tool_permission_check",
-                component="ToolValidator",
-                additional_info={"tool_name": tool_name}
-            )
+            context = self._tool_context(self._CTX_PERMISSION_SUBPROCESS, tool_name)
             self.error_handler.handle_error(e, context)
             return False
 
@@ -675,8 +722,24 @@ def with_retry(max_retries: int = 3, error_types: Tuple = (Exception,)):
         Decorated function with retry logic
     """
     def decorator(func: Callable) -> Callable:
+        # Shared by all calls of func; created on the first failure only
+        error_handler = None
+        # Retry contexts differ only in the attempt number. The final attempt
+        # re-raises without one, and network errors leave them unmodified
+        contexts = tuple(
+            ErrorContext(
+                error_type=ErrorType.NETWORK_ERROR,  # Default to network error
+                severity=ErrorSeverity.MEDIUM,
+                operation=func.__name__,
+                component="RetryDecorator",
+                retry_count=attempt,
+                max_retries=max_retries
+            )
+            for attempt in range(max_retries)
+        )
+        
         def wrapper(*args, **kwargs) -> Any:
-            error_handler = ErrorHandler()
+            nonlocal error_handler
             
             for attempt in range(max_retries + 1):
                 try:
@@ -685,16 +748,9 @@ def with_retry(max_retries: int = 3, error_types: Tuple = (Exception,)):
                     if attempt == max_retries:
                         raise  # Re-raise on final attempt
                     
-                    context = ErrorContext(
-                        error_type=ErrorType.NETWORK_ERROR,  # Default to network error
-                        severity=ErrorSeverity.MEDIUM,
-                        operation=func.__name__,
-                        component="RetryDecorator",
-                        retry_count=attempt,
-                        max_retries=max_retries
-                    )
-                    
-                    should_retry = error_handler.handle_error(e, context)
+                    if error_handler is None:
+                        error_handler = ErrorHandler()
+                    should_retry = error_handler.handle_error(e, contexts[attempt])
                     if not should_retry:
                         raise
             
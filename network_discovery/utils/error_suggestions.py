@@ -0,0 +1,142 @@
+"""
+Troubleshooting suggestions for the ErrorHandler.
+
+Only needed when an operation fails for good, so ErrorHandler imports this
+module on first use instead of at startup.
+"""
+
+from .error_handler import ErrorContext
+from .logger import Logger, LogLevel
+
+
+# Troubleshooting suggestions, each logged as one multi-line message
+SUGGESTIONS = {
+    key: "\n".join(lines)
+    for key, lines in {
+        "network": (
+            "Network troubleshooting suggestions:",
+            "  • Check network connectivity: ping 8.8.8.8",
+            "  • Verify DNS resolution: nslookup google.com",
+            "  • Check firewall settings",
+            "  • Ensure target network is reachable",
+            "  • Try running with elevated privileges",
+        ),
+        "permission_nmap": (
+            "Permission error solutions:",
+            "  • Run with sudo: sudo python -m network_discovery",
+            "  • Use non-privileged scan types (-sT instead of -sS)",
+            "  • Configure nmap with appropriate capabilities",
+        ),
+        "permission_arp": (
+            "Permission error solutions:",
+            "  • Run with sudo: sudo python -m network_discovery",
+            "  • Use scapy method instead of arping",
+            "  • Check network interface permissions",
+        ),
+        "permission_generic": (
+            "Permission error solutions:",
+            "  • Run with elevated privileges (sudo)",
+            "  • Check file/directory permissions",
+            "  • Ensure user has necessary group memberships",
+        ),
+        "config": (
+            "Configuration error solutions:",
+            "  • Check YAML syntax and indentation",
+            "  • Verify all required configuration keys are present",
+            "  • Ensure configuration values are valid",
+            "  • Check file permissions for configuration files",
+            "  • Use default configuration as reference",
+        ),
+        "validation": (
+            "Validation error solutions:",
+            "  • Check input format and syntax",
+            "  • Verify IP addresses are in correct format",
+            "  • Ensure network ranges are valid",
+            "  • Check that required parameters are provided",
+        ),
+        "timeout": (
+            "Timeout error solutions:",
+            "  • Increase timeout values in configuration",
+            "  • Check network latency to target hosts",
+            "  • Reduce scan scope or parallelism",
+            "  • Verify target hosts are responsive",
+        ),
+        "subprocess": (
+            "Subprocess error solutions:",
+            "  • Verify external tools are properly installed",
+            "  • Check tool versions for compatibility",
+            "  • Ensure sufficient system resources",
+            "  • Review command-line arguments",
+        ),
+        "file": (
+            "File system error solutions:",
+            "  • Check file and directory permissions",
+            "  • Verify sufficient disk space",
+            "  • Ensure parent directories exist",
+            "  • Check for file locks or conflicts",
+        ),
+    }.items()
+}
+
+# Installation suggestions for known external tools
+TOOL_SUGGESTIONS = {
+    tool_name: "\n".join(
+        [f"Installation suggestions for {tool_name}:"]
+        + [f"  • {suggestion}" for suggestion in suggestions]
+    )
+    for tool_name, suggestions in {
+        "nmap": (
+            "Ubuntu/Debian: sudo apt-get install nmap",
+            "CentOS/RHEL: sudo yum install nmap",
+            "macOS: brew install nmap",
+            "Windows: Download from https://nmap.org/download.html",
+        ),
+        "arping": (
+            "Ubuntu/Debian: sudo apt-get install arping",
+            "CentOS/RHEL: sudo yum install arping",
+            "macOS: brew install arping",
+            "Windows: Use Windows Subsystem for Linux (WSL)",
+        ),
+        "snmpwalk": (
+            "Ubuntu/Debian: sudo apt-get install snmp-utils",
+            "CentOS/RHEL: sudo yum install net-snmp-utils",
+            "macOS: brew install net-snmp",
+            "Windows: Download from http://www.net-snmp.org/",
+        ),
+    }.items()
+}
+
+
+def emit(
+    category: str, logger: Logger, context: ErrorContext, error: Exception = None
+) -> None:
+    """
+    Log the troubleshooting suggestions for a failed operation.
+
+    Args:
+        category: Suggestion category ("network", "permission", "tool",
+            "config", "validation", "timeout", "subprocess" or "file")
+        logger: Logger to write the suggestions to
+        context: ErrorContext of the failure
+        error: The exception that occurred (optional)
+    """
+    if not logger.is_enabled_for(LogLevel.INFO):
+        return
+
+    if category == "permission":
+        operation = context.operation.lower()
+        if "nmap" in operation:
+            logger.info(SUGGESTIONS["permission_nmap"])
+        elif "arp" in operation:
+            logger.info(SUGGESTIONS["permission_arp"])
+        else:
+            logger.info(SUGGESTIONS["permission_generic"])
+    elif category == "tool":
+        tool_name = context.additional_info.get("tool_name", "unknown")
+        suggestions = TOOL_SUGGESTIONS.get(tool_name)
+        if suggestions:
+            logger.info(suggestions)
+        else:
+            logger.info(f"Please install {tool_name} using your system's package manager")
+    else:
+        logger.info(SUGGESTIONS[category])
@@ -8,13 +8,105 @@ collision handling, and schema compliance.
 
 import json
 import os
+import socket
+import types
+from contextlib import suppress
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import asdict
+from typing import BinaryIO, Dict, Any, List, Optional, Union
+from dataclasses import fields, is_dataclass
 
-from ..core.data_models import CompleteScanResult, DeviceInfo, DeviceType, ScanStatus
+from ..core.data_models import (
+    CompleteScanResult,
+    DeviceInfo,
+    DeviceType,
+    ScanMetadata,
+    ScanStatistics,
+    ScanStatus,
+)
 from .logger import get_logger
+from .manufacturers import match_manufacturer
+
+try:
+    # Optional fast JSON encoder for report output
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Larger than any IPv4 address, so invalid addresses sort last
+_INVALID_IP_SORT_KEY = 1 << 32
+
+# Report write buffer; streamed reports arrive in many tiny chunks
+_STREAM_BUFFER_SIZE = 128 * 1024
+
+# Common OIDs for manufacturer information, in lookup order
+_MANUFACTURER_OIDS = (
+    "1.3.6.1.2.1.1.1.0",  # sysDescr
+    "1.3.6.1.4.1.9.9.25.1.1.1.2",  # Cisco specific
+)
+
+# Stand-in for a scanner that has no result for an address
+_NO_RESULT = types.MappingProxyType({})
+
+# Report sections built by _convert_to_json_format; metadata, statistics and
+# devices stay dataclasses until they are encoded
+ReportData = Dict[
+    str, Union[ScanMetadata, ScanStatistics, Dict[str, Any], List[DeviceInfo]]
+]
+
+# Keys validate_json_schema requires in a report and its scan_metadata
+_REQUIRED_TOP_LEVEL_KEYS = frozenset(
+    ("scan_metadata", "network_info", "scan_statistics", "devices")
+)
+_REQUIRED_METADATA_KEYS = frozenset(
+    ("timestamp", "scan_duration", "network_scanned", "host_ip")
+)
+
+
+def _keys(obj: Any) -> frozenset:
+    """
+    Get the field names of a report section.
+    
+    Args:
+        obj: Dataclass instance or mapping
+        
+    Returns:
+        frozenset: Field names of a dataclass, keys of a mapping
+    """
+    if is_dataclass(obj):
+        return frozenset(field.name for field in fields(obj))
+    return frozenset(obj.keys())
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize objects the JSON encoders do not handle natively.
+    
+    orjson serializes dataclasses, enums and datetimes itself; this is the
+    standard library encoder's equivalent. Naive datetimes are taken as UTC
+    and UTC is written as "Z", as with orjson's OPT_NAIVE_UTC | OPT_UTC_Z.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON-serializable representation of obj
+    """
+    if isinstance(obj, datetime):
+        offset = obj.utcoffset()
+        if offset is None:
+            return obj.isoformat() + "Z"
+        if not offset:
+            return obj.replace(tzinfo=None).isoformat() + "Z"
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj):
+        return vars(obj)
+    return str(obj)
 
 
 class JSONReporter:
@@ -28,6 +120,10 @@ class JSONReporter:
     - Merging results from multiple scanners into unified device records
     """
     
+    # Reports with more devices than this are encoded incrementally, so the
+    # whole document is never held in memory at once
+    stream_threshold = 5000
+    
     def __init__(self, output_directory: str = "network_discovery/results"):
         """
         Initialize the JSON reporter.
@@ -58,7 +154,7 @@ class JSONReporter:
         if not scan_result:
             raise ValueError("Scan result cannot be None or empty")
             
-        self.logger.info(f"Generating JSON report for scan completed at {scan_result.scan_metadata.timestamp}")
+        self.logger.info("Generating JSON report for scan completed at %s", scan_result.scan_metadata.timestamp)
         
         # Convert scan result to JSON-serializable format
         json_data = self._convert_to_json_format(scan_result)
@@ -72,45 +168,33 @@ class JSONReporter:
         
         # Write JSON file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
+            self._write_report(
+                json_data, filepath, stream=len(scan_result.devices) > self.stream_threshold
+            )
                 
-            self.logger.info(f"JSON report successfully generated: {filepath}")
+            self.logger.info("JSON report successfully generated: %s", filepath)
             return str(filepath)
             
         except IOError as e:
             self.logger.error(f"Failed to write JSON report to {filepath}: {e}")
             raise
             
-    def _convert_to_json_format(self, scan_result: CompleteScanResult) -> Dict[str, Any]:
+    def _convert_to_json_format(self, scan_result: CompleteScanResult) -> ReportData:
         """
-        Convert CompleteScanResult to JSON-serializable dictionary format.
+        Build the top-level report structure from scan results.
+        
+        Metadata, statistics and devices stay dataclasses and are serialized
+        by the encoder; only the network info is summarized, since the scan
+        range itself is not reported. Open ports are written as stored; they
+        are sorted when scanner results are merged.
         
         Args:
             scan_result: Complete scan result data structure
             
         Returns:
-            Dict containing JSON-serializable scan data
+            ReportData: Report sections, ready for _encode_json; scan_metadata
+            and scan_statistics are dataclasses, devices a list of DeviceInfo
         """
-        # Convert scan metadata
-        scan_metadata = {
-            "timestamp": scan_result.scan_metadata.timestamp.isoformat() + "Z",
-            "scan_duration": scan_result.scan_metadata.scan_duration,
-            "network_scanned": scan_result.scan_metadata.network_scanned,
-            "host_ip": scan_result.scan_metadata.host_ip,
-            "excluded_addresses": scan_result.scan_metadata.excluded_addresses,
-            "configurations_used": scan_result.scan_metadata.configurations_used,
-            "scan_status": scan_result.scan_metadata.scan_status.value
-        }
-        
-        # Convert scan statistics
-        scan_statistics = {
-            "total_addresses_scanned": scan_result.scan_statistics.total_addresses_scanned,
-            "devices_found": scan_result.scan_statistics.devices_found,
-            "scan_times": scan_result.scan_statistics.scan_times,
-            "errors_encountered": scan_result.scan_statistics.errors_encountered
-        }
-        
         # Convert network info
         network_info = {
             "host_ip": scan_result.network_info.host_ip,
@@ -121,33 +205,96 @@ class JSONReporter:
             "scan_range_size": len(scan_result.network_info.scan_range)
         }
         
-        # Convert devices
-        devices = []
-        for device in scan_result.devices:
-            device_dict = {
-                "ip_address": device.ip_address,
-                "mac_address": device.mac_address,
-                "hostname": device.hostname,
-                "device_type": device.device_type.value,
-                "os_info": device.os_info,
-                "manufacturer": device.manufacturer,
-                "model": device.model,
-                "open_ports": sorted(device.open_ports),
-                "services": device.services,
-                "snmp_data": device.snmp_data
-            }
-            devices.append(device_dict)
-        
-        # Sort devices by IP address for consistent output
-        devices.sort(key=lambda x: self._ip_sort_key(x["ip_address"]))
-        
         return {
-            "scan_metadata": scan_metadata,
+            "scan_metadata": scan_result.scan_metadata,
             "network_info": network_info,
-            "scan_statistics": scan_statistics,
-            "devices": devices
+            "scan_statistics": scan_result.scan_statistics,
+            # Sort devices by IP address for consistent output
+            "devices": sorted(
+                scan_result.devices,
+                key=lambda device: self._ip_sort_key(device.ip_address)
+            )
         }
         
+    def _encode_json(self, json_data: ReportData) -> bytes:
+        """
+        Encode report data as indented UTF-8 JSON.
+        
+        Uses orjson when it is installed, otherwise the standard library
+        encoder with the same formatting.
+        
+        Args:
+            json_data: Report data from _convert_to_json_format
+            
+        Returns:
+            bytes: Encoded report
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                json_data,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_NAIVE_UTC
+                    | orjson.OPT_UTC_Z
+                ),
+                default=_json_default
+            )
+        return json.dumps(
+            json_data, indent=2, ensure_ascii=False, default=_json_default
+        ).encode('utf-8')
+        
+    def _write_report(self, json_data: ReportData, filepath: Path, stream: bool) -> None:
+        """
+        Write report data to a file atomically.
+        
+        The report is written to a temporary file in the same directory and
+        renamed into place, so an interrupted or failed write never leaves a
+        truncated report under the final name.
+        
+        Args:
+            json_data: Report data from _convert_to_json_format
+            filepath: Final path of the report file, as reserved by
+                _handle_file_collision
+            stream: Encode incrementally instead of all at once
+        """
+        temp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+        try:
+            # Encode up front so the file is written in a single call
+            payload = None if stream else self._encode_json(json_data)
+            
+            with open(temp_path, 'wb', buffering=_STREAM_BUFFER_SIZE) as f:
+                if payload is None:
+                    self._write_json_streamed(json_data, f)
+                else:
+                    f.write(payload)
+                f.flush()
+                # Persist the data before the rename makes it visible
+                os.fsync(f.fileno())
+            os.replace(temp_path, filepath)
+        except BaseException:
+            # Don't leave a partial temporary file or the reserved empty
+            # report file behind
+            for path in (temp_path, filepath):
+                with suppress(OSError):
+                    path.unlink()
+            raise
+            
+    def _write_json_streamed(self, json_data: ReportData, f: BinaryIO) -> None:
+        """
+        Encode report data chunk by chunk straight into a file.
+        
+        Produces the same document as _encode_json, trading encoding speed
+        for bounded memory use.
+        
+        Args:
+            json_data: Report data from _convert_to_json_format
+            f: Binary file to write the report to
+        """
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+        for chunk in encoder.iterencode(json_data):
+            f.write(chunk.encode('utf-8'))
+                
     def _generate_filename(self, timestamp: datetime) -> str:
         """
         Generate a filename based on timestamp.
@@ -166,35 +313,56 @@ class JSONReporter:
         """
         Handle filename collisions by adding incremental suffix.
         
+        The chosen path is reserved by creating it as an empty file, so
+        concurrent scans never pick the same name.
+        
         Args:
             filepath: Original file path
             
         Returns:
-            Path: Unique file path
+            Path: Unique file path, reserved for the report
         """
-        if not filepath.exists():
+        if self._reserve_path(filepath):
             return filepath
             
         # Extract base name and extension
         base_name = filepath.stem
         extension = filepath.suffix
-        counter = 1
         
-        while True:
+        # One directory listing to skip the names already taken
+        with os.scandir(filepath.parent) as entries:
+            existing_names = {entry.name for entry in entries}
+        
+        # Safety cap to prevent an unbounded search
+        for counter in range(1, 1000):
             new_name = f"{base_name}_{counter:03d}{extension}"
             new_filepath = filepath.parent / new_name
             
-            if not new_filepath.exists():
-                self.logger.info(f"File collision detected, using filename: {new_name}")
+            if new_name not in existing_names and self._reserve_path(new_filepath):
+                self.logger.info("File collision detected, using filename: %s", new_name)
                 return new_filepath
                 
-            counter += 1
+        raise IOError(f"Too many file collisions for {filepath}")
+        
+    @staticmethod
+    def _reserve_path(filepath: Path) -> bool:
+        """
+        Atomically create an empty file unless the path already exists.
+        
+        Args:
+            filepath: Path to reserve
             
-            # Safety check to prevent infinite loop
-            if counter > 999:
-                raise IOError(f"Too many file collisions for {filepath}")
+        Returns:
+            bool: True if the file was created, False if it already existed
+        """
+        try:
+            fd = os.open(filepath, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
                 
-    def _ip_sort_key(self, ip_address: str) -> tuple:
+    def _ip_sort_key(self, ip_address: str) -> int:
         """
         Generate sort key for IP address to enable proper sorting.
         
@@ -202,13 +370,13 @@ class JSONReporter:
             ip_address: IP address string
             
         Returns:
-            tuple: Sort key for IP address
+            int: Sort key for IP address, the address as a 32-bit integer
         """
         try:
-            return tuple(int(part) for part in ip_address.split('.'))
-        except (ValueError, AttributeError):
-            # Fallback for invalid IP addresses
-            return (999, 999, 999, 999)
+            return int.from_bytes(socket.inet_pton(socket.AF_INET, ip_address), "big")
+        except (OSError, TypeError):
+            # Fallback for invalid IP addresses, sorted after all valid ones
+            return _INVALID_IP_SORT_KEY
             
     def merge_scanner_results(self, arp_results: Dict[str, Any], 
                             nmap_results: Dict[str, Any], 
@@ -228,34 +396,33 @@ class JSONReporter:
         
         unified_devices = {}
         
-        # Start with ARP results as base (active devices)
-        for ip, arp_data in arp_results.items():
+        # ARP results are the base (active devices), followed by devices
+        # found by NMAP but not ARP (possible if ARP failed). SNMP results
+        # only enrich devices found by one of the two
+        ips = list(arp_results)
+        ips.extend(ip for ip in nmap_results if ip not in arp_results)
+        
+        for ip in ips:
+            arp_data = arp_results.get(ip, _NO_RESULT)
+            nmap_data = nmap_results.get(ip, _NO_RESULT)
+            
+            # Use the NMAP hostname if ARP did not provide one
+            hostname = arp_data.get('hostname')
+            if not hostname and nmap_data.get('hostname'):
+                hostname = nmap_data['hostname']
+                
             device = DeviceInfo(
                 ip_address=ip,
                 mac_address=arp_data.get('mac_address'),
-                hostname=arp_data.get('hostname')
+                hostname=hostname,
+                os_info=nmap_data.get('os_info'),
+                # Sorted once here rather than on every report generation
+                open_ports=sorted(nmap_data.get('open_ports', ())),
+                services=nmap_data.get('services', {})
             )
-            unified_devices[ip] = device
             
-        # Merge NMAP results
-        for ip, nmap_data in nmap_results.items():
-            if ip not in unified_devices:
-                # Device found by NMAP but not ARP (possible if ARP failed)
-                unified_devices[ip] = DeviceInfo(ip_address=ip)
-                
-            device = unified_devices[ip]
-            device.os_info = nmap_data.get('os_info')
-            device.open_ports = nmap_data.get('open_ports', [])
-            device.services = nmap_data.get('services', {})
-            
-            # Update hostname if not set and available from NMAP
-            if not device.hostname and nmap_data.get('hostname'):
-                device.hostname = nmap_data['hostname']
-                
-        # Merge SNMP results
-        for ip, snmp_data in snmp_results.items():
-            if ip in unified_devices:
-                device = unified_devices[ip]
+            snmp_data = snmp_results.get(ip)
+            if snmp_data is not None:
                 device.snmp_data = snmp_data.get('oid_values', {})
                 
                 # Extract manufacturer and model from SNMP if available
@@ -263,7 +430,9 @@ class JSONReporter:
                     device.manufacturer = self._extract_manufacturer_from_snmp(device.snmp_data)
                     device.model = self._extract_model_from_snmp(device.snmp_data)
                     
-        self.logger.info(f"Successfully merged results for {len(unified_devices)} devices")
+            unified_devices[ip] = device
+            
+        self.logger.info("Successfully merged results for %d devices", len(unified_devices))
         return unified_devices
         
     def _extract_manufacturer_from_snmp(self, snmp_data: Dict[str, str]) -> Optional[str]:
@@ -276,26 +445,12 @@ class JSONReporter:
         Returns:
             Optional[str]: Manufacturer name if found
         """
-        # Common OIDs for manufacturer information
-        manufacturer_oids = [
-            "1.3.6.1.2.1.1.1.0",  # sysDescr
-            "1.3.6.1.4.1.9.9.25.1.1.1.2",  # Cisco specific
-        ]
-        
-        for oid in manufacturer_oids:
-            if oid in snmp_data:
-                value = snmp_data[oid].lower()
-                # Simple manufacturer detection
-                if "cisco" in value:
-                    return "Cisco"
-                elif "hp" in value or "hewlett" in value:
-                    return "HP"
-                elif "dell" in value:
-                    return "Dell"
-                elif "netgear" in value:
-                    return "Netgear"
-                elif "d-link" in value:
-                    return "D-Link"
+        for oid in _MANUFACTURER_OIDS:
+            value = snmp_data.get(oid)
+            if value:
+                manufacturer = match_manufacturer(value.lower())
+                if manufacturer:
+                    return manufacturer
                     
         return None
         
@@ -321,31 +476,30 @@ class JSONReporter:
                     
         return None
         
-    def validate_json_schema(self, json_data: Dict[str, Any]) -> bool:
+    def validate_json_schema(self, json_data: Union[ReportData, Dict[str, Any]]) -> bool:
         """
         Validate that the JSON data matches the expected schema.
         
+        Accepts both the output of _convert_to_json_format, whose sections
+        are dataclasses, and a report decoded from JSON.
+        
         Args:
             json_data: JSON data to validate
             
         Returns:
             bool: True if schema is valid, False otherwise
         """
-        required_top_level_keys = ["scan_metadata", "network_info", "scan_statistics", "devices"]
-        
         # Check top-level structure
-        for key in required_top_level_keys:
-            if key not in json_data:
-                self.logger.error(f"Missing required top-level key: {key}")
-                return False
+        missing = _REQUIRED_TOP_LEVEL_KEYS - json_data.keys()
+        if missing:
+            self.logger.error(f"Missing required top-level keys: {', '.join(sorted(missing))}")
+            return False
                 
         # Validate scan_metadata structure
-        metadata = json_data["scan_metadata"]
-        required_metadata_keys = ["timestamp", "scan_duration", "network_scanned", "host_ip"]
-        for key in required_metadata_keys:
-            if key not in metadata:
-                self.logger.error(f"Missing required metadata key: {key}")
-                return False
+        missing = _REQUIRED_METADATA_KEYS - _keys(json_data["scan_metadata"])
+        if missing:
+            self.logger.error(f"Missing required metadata keys: {', '.join(sorted(missing))}")
+            return False
                 
         # Validate devices structure
         devices = json_data["devices"]
@@ -353,10 +507,9 @@ class JSONReporter:
             self.logger.error("Devices must be a list")
             return False
             
-        for device in devices:
-            if "ip_address" not in device:
-                self.logger.error("Device missing required ip_address field")
-                return False
+        if not all("ip_address" in _keys(device) for device in devices):
+            self.logger.error("Device missing required ip_address field")
+            return False
                 
         self.logger.info("JSON schema validation passed")
         return True
\ No newline at end of file
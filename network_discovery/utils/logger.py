@@ -8,13 +8,21 @@ indicators for long-running operations.
 
 import sys
 import time
-from datetime import datetime
+import types
 from enum import Enum
-from typing import Optional, Any
+from typing import Dict, Optional, Any
 from colorama import Fore, Back, Style, init
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+if sys.stdout is not None and sys.stdout.isatty():
+    # Initialize colorama for cross-platform colored output
+    init(autoreset=True)
+else:
+    # Output is piped or redirected, where colorama would strip the escape
+    # codes from every write; emit none instead and leave stdout unwrapped
+    Fore, Back, Style = (
+        types.SimpleNamespace(**dict.fromkeys(vars(codes), ""))
+        for codes in (Fore, Back, Style)
+    )
 
 
 class LogLevel(Enum):
@@ -26,6 +34,15 @@ class LogLevel(Enum):
     ERROR = "ERROR"
 
 
+# Severity rank of each level, for threshold comparisons
+_LEVEL_RANKS = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARNING: 2,
+    LogLevel.ERROR: 3,
+}
+
+
 class Logger:
     """
     Logger class with colored console output and progress indicators.
@@ -65,6 +82,22 @@ class Logger:
         self._progress_active = False
         self._last_progress_length = 0
 
+        # Colored "<symbol> <LEVEL>" prefix per level, built once
+        self._level_prefixes = {
+            level: f"{color}{self.LEVEL_SYMBOLS[level]} {level.value:<7}{Style.RESET_ALL}"
+            for level, color in self.LEVEL_COLORS.items()
+        }
+
+    @property
+    def min_level(self) -> LogLevel:
+        """Minimum log level to display."""
+        return self._min_level
+
+    @min_level.setter
+    def min_level(self, level: LogLevel) -> None:
+        self._min_level = level
+        self._min_rank = _LEVEL_RANKS[level]
+
     def _should_log(self, level: LogLevel) -> bool:
         """
         Check if a message should be logged based on minimum level.
@@ -75,13 +108,21 @@ class Logger:
         Returns:
             True if message should be logged, False otherwise
         """
-        level_order = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.WARNING: 2,
-            LogLevel.ERROR: 3,
-        }
-        return level_order[level] >= level_order[self.min_level]
+        return _LEVEL_RANKS[level] >= self._min_rank
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """
+        Check whether messages of a level would be displayed.
+
+        Lets callers skip building expensive messages that would be dropped.
+
+        Args:
+            level: Log level to check
+
+        Returns:
+            True if messages of this level are logged, False otherwise
+        """
+        return self._should_log(level)
 
     def _format_timestamp(self) -> str:
         """
@@ -90,30 +131,29 @@ class Logger:
         Returns:
             Formatted timestamp string
         """
-        return datetime.now().strftime("%H:%M:%S")
+        return time.strftime("%H:%M:%S")
 
-    def _log(self, level: LogLevel, message: str, **kwargs) -> None:
+    def _log(self, level: LogLevel, message: str, *args, **kwargs) -> None:
         """
         Internal logging method that handles formatting and output.
 
         Args:
             level: Log level
-            message: Message to log
+            message: Message to log, with %-style placeholders if args given
+            *args: Values for the message placeholders, only interpolated
+                if the message is logged
             **kwargs: Additional formatting arguments
         """
         if not self._should_log(level):
             return
 
-        # Format the log message
-        timestamp = self._format_timestamp()
-        color = self.LEVEL_COLORS[level]
-        symbol = self.LEVEL_SYMBOLS[level]
+        if args:
+            message = message % args
 
         # Build the formatted message
         formatted_message = (
-            f"{Style.DIM}[{timestamp}]{Style.RESET_ALL} "
-            f"{color}{symbol} {level.value:<7}{Style.RESET_ALL} "
-            f"{message}"
+            f"{Style.DIM}[{self._format_timestamp()}]{Style.RESET_ALL} "
+            f"{self._level_prefixes[level]} {message}"
         )
 
         # Add any additional formatting
@@ -126,35 +166,38 @@ class Logger:
             file=sys.stdout if level != LogLevel.ERROR else sys.stderr,
         )
 
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """
         Log a debug message.
 
         Args:
             message: Debug message
+            *args: Values for %-style placeholders in the message
             **kwargs: Additional context information
         """
-        self._log(LogLevel.DEBUG, message, **kwargs)
+        self._log(LogLevel.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """
         Log an info message.
 
         Args:
             message: Info message
+            *args: Values for %-style placeholders in the message
             **kwargs: Additional context information
         """
-        self._log(LogLevel.INFO, message, **kwargs)
+        self._log(LogLevel.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """
         Log a warning message.
 
         Args:
             message: Warning message
+            *args: Values for %-style placeholders in the message
             **kwargs: Additional context information
         """
-        self._log(LogLevel.WARNING, message, **kwargs)
+        self._log(LogLevel.WARNING, message, *args, **kwargs)
 
     def error(
         self, message: str, exception: Optional[Exception] = None, **kwargs
@@ -171,17 +214,21 @@ class Logger:
             kwargs["exception"] = f"{type(exception).__name__}: {str(exception)}"
         self._log(LogLevel.ERROR, message, **kwargs)
 
-    def success(self, message: str, **kwargs) -> None:
+    def success(self, message: str, *args, **kwargs) -> None:
         """
         Log a success message (formatted as INFO with special styling).
 
         Args:
             message: Success message
+            *args: Values for %-style placeholders in the message
             **kwargs: Additional context information
         """
         if not self._should_log(LogLevel.INFO):
             return
 
+        if args:
+            message = message % args
+
         if self._progress_active:
             self._clear_progress()
 
@@ -283,15 +330,16 @@ class Logger:
         if not self._should_log(LogLevel.INFO):
             return
 
-        # Print header row
         header_row = " | ".join(
             [f"{header:<{width}}" for header, width in zip(headers, widths)]
         )
-        print(f"{Style.BRIGHT}{header_row}{Style.RESET_ALL}")
-
-        # Print separator
         separator = "-+-".join(["-" * width for width in widths])
-        print(f"{Style.DIM}{separator}{Style.RESET_ALL}")
+
+        # Print header row and separator in a single write
+        print(
+            f"{Style.BRIGHT}{header_row}{Style.RESET_ALL}\n"
+            f"{Style.DIM}{separator}{Style.RESET_ALL}"
+        )
 
     def table_row(
         self, values: list[str], widths: list[int], highlight: bool = False
@@ -328,10 +376,10 @@ class Logger:
         if not self._should_log(LogLevel.INFO):
             return
 
-        print(f"\n{Fore.CYAN}{Style.BRIGHT}🌐 NETWORK CONFIGURATION{Style.RESET_ALL}")
-        print(f"  Network Range: {Style.BRIGHT}{network}{Style.RESET_ALL}")
-        print(f"  Host IP:       {Style.BRIGHT}{host_ip}{Style.RESET_ALL}")
         print(
+            f"\n{Fore.CYAN}{Style.BRIGHT}🌐 NETWORK CONFIGURATION{Style.RESET_ALL}\n"
+            f"  Network Range: {Style.BRIGHT}{network}{Style.RESET_ALL}\n"
+            f"  Host IP:       {Style.BRIGHT}{host_ip}{Style.RESET_ALL}\n"
             f"  Excluded IPs:  {Style.BRIGHT}{', '.join(excluded)}{Style.RESET_ALL}\n"
         )
 
@@ -339,26 +387,38 @@ class Logger:
 # Global logger instance
 logger = Logger()
 
+# Loggers handed out by get_logger, by name
+_loggers: Dict[str, Logger] = {logger.name: logger}
+
 
 def set_log_level(level: LogLevel) -> None:
     """
     Set the global log level.
 
+    Applies to the global logger and every logger returned by get_logger,
+    including those created later.
+
     Args:
         level: Minimum log level to display
     """
-    global logger
-    logger.min_level = level
+    for named_logger in list(_loggers.values()):
+        named_logger.min_level = level
 
 
 def get_logger(name: str = "NetworkDiscovery") -> Logger:
     """
     Get a logger instance with the specified name.
 
+    Loggers are shared per name; the first call for a name creates it at
+    the global log level.
+
     Args:
         name: Logger name
 
     Returns:
         Logger instance
     """
-    return Logger(name)
+    named_logger = _loggers.get(name)
+    if named_logger is None:
+        named_logger = _loggers.setdefault(name, Logger(name, logger.min_level))
+    return named_logger
@@ -0,0 +1,92 @@
+"""
+Manufacturer identification from SNMP system descriptions.
+
+Holds the manufacturer pattern table shared by the SNMP scanner and the JSON
+reporter, compiled once at import into a single-pass matcher.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+try:
+    # Optional Aho-Corasick automaton for manufacturer pattern matching
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Common manufacturer patterns in system descriptions
+MANUFACTURER_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "cisco": ("Cisco", "IOS"),
+    "hp": ("HP", "Hewlett", "Packard"),
+    "dell": ("Dell",),
+    "juniper": ("Juniper", "JUNOS"),
+    "netgear": ("NETGEAR", "Netgear"),
+    "linksys": ("Linksys",),
+    "dlink": ("D-Link", "DLink"),
+    "tplink": ("TP-Link", "TP-LINK"),
+    "ubiquiti": ("Ubiquiti", "UniFi"),
+    "mikrotik": ("MikroTik", "RouterOS"),
+    "fortinet": ("Fortinet", "FortiGate"),
+    "paloalto": ("Palo Alto", "PAN-OS"),
+    "aruba": ("Aruba",),
+    "extreme": ("Extreme", "ExtremeXOS"),
+}
+
+# Manufacturer names as written in reports; keys of MANUFACTURER_PATTERNS
+# without an entry are title-cased
+_DISPLAY_NAMES: Dict[str, str] = {
+    "hp": "HP",
+    "netgear": "Netgear",
+    "dlink": "D-Link",
+    "tplink": "TP-Link",
+    "mikrotik": "MikroTik",
+    "paloalto": "Palo Alto Networks",
+    "extreme": "Extreme Networks",
+}
+
+# Lowercased pattern -> (table position, manufacturer name); earlier table
+# entries win when several manufacturers match
+_LOOKUP: Dict[str, Tuple[int, str]] = {}
+for _priority, (_manufacturer, _patterns) in enumerate(MANUFACTURER_PATTERNS.items()):
+    _name = _DISPLAY_NAMES.get(_manufacturer, _manufacturer.title())
+    for _pattern in _patterns:
+        _LOOKUP.setdefault(_pattern.lower(), (_priority, _name))
+
+if AHOCORASICK_AVAILABLE:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _pattern, _entry in _LOOKUP.items():
+        _AUTOMATON.add_word(_pattern, _entry)
+    _AUTOMATON.make_automaton()
+else:
+    # Lookahead so overlapping matches at every position are reported
+    _PATTERN_RE = re.compile(
+        "(?=({}))".format(
+            "|".join(map(re.escape, sorted(_LOOKUP, key=len, reverse=True)))
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def match_manufacturer(text: str) -> Optional[str]:
+    """
+    Find the manufacturer named in a lowercased system description.
+
+    Scans the text once with an Aho-Corasick automaton when pyahocorasick is
+    installed, otherwise with a single precompiled regex. Results are cached,
+    since devices of the same model report identical descriptions.
+
+    Args:
+        text: Lowercased system description
+
+    Returns:
+        Manufacturer name or None
+    """
+    if AHOCORASICK_AVAILABLE:
+        matches = (entry for _, entry in _AUTOMATON.iter(text))
+    else:
+        matches = (_LOOKUP[m.group(1)] for m in _PATTERN_RE.finditer(text))
+    return min(matches, default=(None, None))[1]
@@ -3,11 +3,234 @@ Network utility functions for IP address calculations and network operations.
 
 This module provides helper functions for common network operations such as
 IP address validation, CIDR calculations, and network range operations.
+
+Addresses are handled as 32-bit integers wherever possible: dotted-decimal
+strings are parsed with socket.inet_pton, which accepts exactly the strings
+ipaddress.IPv4Address does, and formatted from a precomputed octet table.
+The ipaddress module is only used for less common inputs (integer or packed
+addresses, host masks) and to produce its error messages, so results match
+the plain ipaddress implementation.
 """
 
+import asyncio
 import ipaddress
+import platform
+import shutil
 import socket
-from typing import List, Tuple, Optional
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple, Optional
+
+try:
+    # Optional vectorized address classification in classify_ips
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    # Optional JIT compilation of the fused classify_ips kernel
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Decimal text of every octet value, for formatting addresses from integers
+_OCTETS = tuple(str(octet) for octet in range(256))
+
+
+def _ip_to_int(ip_address: str) -> Optional[int]:
+    """
+    Parse a dotted-decimal IPv4 address into its 32-bit integer value.
+    
+    inet_pton accepts exactly the strings ipaddress.IPv4Address does (four
+    decimal octets up to 255, no leading zeros) but parses them in C,
+    without creating an address object.
+    
+    Args:
+        ip_address: String to parse as IPv4 address
+        
+    Returns:
+        Optional[int]: Address as an integer, None if the string is invalid
+    """
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, ip_address), "big")
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _int_to_ip(value: int) -> str:
+    """
+    Format a 32-bit integer as a dotted-decimal IPv4 address.
+    
+    Args:
+        value: Address as an integer
+        
+    Returns:
+        str: Dotted-decimal address
+    """
+    return (
+        f"{_OCTETS[value >> 24]}.{_OCTETS[(value >> 16) & 0xFF]}."
+        f"{_OCTETS[(value >> 8) & 0xFF]}.{_OCTETS[value & 0xFF]}"
+    )
+
+
+# Dotted netmask of every prefix length, and prefix length of every netmask
+# or prefix length string; other netmask forms go through ipaddress
+_CIDR_TO_NETMASK = tuple(
+    _int_to_ip((0xFFFFFFFF << (32 - cidr)) & 0xFFFFFFFF) for cidr in range(33)
+)
+_NETMASK_TO_CIDR = {
+    **{netmask: cidr for cidr, netmask in enumerate(_CIDR_TO_NETMASK)},
+    **{str(cidr): cidr for cidr in range(33)},
+}
+
+# (netmask, network) integer pairs of the ranges IPv4Address.is_private
+# treats as private: RFC 1918 plus the IANA special-purpose blocks
+_PRIVATE_RANGES = (
+    (0xFF000000, 0x00000000),  # 0.0.0.0/8
+    (0xFF000000, 0x0A000000),  # 10.0.0.0/8
+    (0xFF000000, 0x7F000000),  # 127.0.0.0/8
+    (0xFFFF0000, 0xA9FE0000),  # 169.254.0.0/16
+    (0xFFF00000, 0xAC100000),  # 172.16.0.0/12
+    (0xFFFFFFF8, 0xC0000000),  # 192.0.0.0/29
+    (0xFFFFFFFE, 0xC00000AA),  # 192.0.0.170/31
+    (0xFFFFFF00, 0xC0000200),  # 192.0.2.0/24
+    (0xFFFF0000, 0xC0A80000),  # 192.168.0.0/16
+    (0xFFFE0000, 0xC6120000),  # 198.18.0.0/15
+    (0xFFFFFF00, 0xC6336400),  # 198.51.100.0/24
+    (0xFFFFFF00, 0xCB007100),  # 203.0.113.0/24
+    (0xF0000000, 0xF0000000),  # 240.0.0.0/4
+    (0xFFFFFFFF, 0xFFFFFFFF),  # 255.255.255.255/32
+)
+
+# Netmask and network of the loopback range 127.0.0.0/8
+_LOOPBACK_MASK = 0xFF000000
+_LOOPBACK_NETWORK = 0x7F000000
+
+# Default cap on ping processes running at once in ping_hosts
+_MAX_CONCURRENT_PINGS = 128
+
+# Default cap on reverse DNS lookups running at once in resolve_hostnames
+_MAX_CONCURRENT_LOOKUPS = 64
+
+# Seconds a resolved hostname is reused before it is looked up again
+_HOSTNAME_CACHE_TTL = 300
+
+# Cap on the number of addresses sweep_network probes; also a sensible
+# opt-in max_size for generate_ip_range
+_MAX_IP_RANGE_SIZE = 1 << 20
+
+# fping sweeps a whole network from one process; None when not installed
+_FPING_PATH = shutil.which("fping")
+
+# Interval in milliseconds between fping probes and retries per target
+_FPING_INTERVAL_MS = 5
+_FPING_RETRIES = 1
+
+
+def _address_to_int(ip_address: Any) -> Optional[int]:
+    """
+    Convert an IPv4 address in any form ipaddress accepts to an integer.
+    
+    Strings take the _ip_to_int fast path; integer and packed addresses
+    go through ipaddress.
+    
+    Args:
+        ip_address: IPv4 address as string, integer or packed bytes
+        
+    Returns:
+        Optional[int]: Address as an integer, None if it is invalid
+    """
+    if isinstance(ip_address, str):
+        return _ip_to_int(ip_address)
+    try:
+        return int(ipaddress.IPv4Address(ip_address))
+    except ipaddress.AddressValueError:
+        return None
+
+
+def _network_bounds(ip_address: str, netmask: str) -> Tuple[int, int, int]:
+    """
+    Compute the network and broadcast addresses of an IP and netmask.
+    
+    Plain IPv4 strings with a dotted netmask or prefix length are handled
+    with integer arithmetic; other forms (host masks, zero-padded prefixes)
+    go through ipaddress.
+    
+    Args:
+        ip_address: IP address within the network
+        netmask: Subnet mask (dotted decimal or CIDR)
+        
+    Returns:
+        Tuple[int, int, int]: Network address, broadcast address, prefix length
+        
+    Raises:
+        ValueError: If IP address or netmask is invalid
+    """
+    ip = _ip_to_int(ip_address) if isinstance(ip_address, str) else None
+    prefix = _NETMASK_TO_CIDR.get(str(netmask))
+    if ip is None or prefix is None:
+        try:
+            network = ipaddress.IPv4Network(f"{ip_address}/{netmask}", strict=False)
+        except ipaddress.AddressValueError as e:
+            raise ValueError(f"Invalid IP or netmask: {ip_address}/{netmask}") from e
+        return int(network.network_address), int(network.broadcast_address), network.prefixlen
+    
+    hostmask = 0xFFFFFFFF >> prefix
+    network_int = ip & ~hostmask
+    return network_int, network_int | hostmask, prefix
+
+
+def _is_private_range(first: int, last: int) -> bool:
+    """
+    Check whether an address range lies within a single private range.
+    
+    Args:
+        first: First address of the range as an integer
+        last: Last address of the range as an integer
+        
+    Returns:
+        bool: True if both ends fall in the same private range
+    """
+    return any(
+        first & netmask == network and last & netmask == network
+        for netmask, network in _PRIVATE_RANGES
+    )
+
+
+@lru_cache(maxsize=4096)
+def _network_and_mask(network: str) -> Tuple[int, int]:
+    """
+    Parse a network into its network address and netmask as integers.
+    
+    Cached, since the same few networks are validated and checked against
+    many addresses during a scan. An address with a dotted netmask or prefix
+    length is parsed directly; other forms go through ipaddress.
+    
+    Args:
+        network: Network in CIDR notation (e.g., "192.168.1.0/24")
+        
+    Returns:
+        Tuple[int, int]: Network address, netmask
+        
+    Raises:
+        ipaddress.AddressValueError: If the network address is invalid
+    """
+    if isinstance(network, str):
+        address, _, netmask = network.partition("/")
+        ip = _ip_to_int(address)
+        prefix = _NETMASK_TO_CIDR.get(netmask)
+        if ip is not None and prefix is not None:
+            hostmask = 0xFFFFFFFF >> prefix
+            return ip & ~hostmask, hostmask ^ 0xFFFFFFFF
+    
+    net = ipaddress.IPv4Network(network, strict=False)
+    return int(net.network_address), int(net.netmask)
 
 
 def is_valid_ip(ip_address: str) -> bool:
@@ -20,11 +243,7 @@ def is_valid_ip(ip_address: str) -> bool:
     Returns:
         bool: True if valid IPv4 address, False otherwise
     """
-    try:
-        ipaddress.IPv4Address(ip_address)
-        return True
-    except ipaddress.AddressValueError:
-        return False
+    return _address_to_int(ip_address) is not None
 
 
 def is_valid_network(network: str) -> bool:
@@ -37,8 +256,16 @@ def is_valid_network(network: str) -> bool:
     Returns:
         bool: True if valid IPv4 network, False otherwise
     """
+    if isinstance(network, str):
+        address, _, netmask = network.partition("/")
+        # IPv4Network rejects a bad address or extra "/" before the netmask
+        if _ip_to_int(address) is None or "/" in netmask:
+            return False
+        if netmask in _NETMASK_TO_CIDR:
+            return True
+    
     try:
-        ipaddress.IPv4Network(network, strict=False)
+        _network_and_mask(network)
         return True
     except ipaddress.AddressValueError:
         return False
@@ -60,9 +287,7 @@ def cidr_to_netmask(cidr: int) -> str:
     if not 0 <= cidr <= 32:
         raise ValueError(f"CIDR must be between 0 and 32, got {cidr}")
     
-    # Create network with dummy IP to get netmask
-    network = ipaddress.IPv4Network(f"0.0.0.0/{cidr}")
-    return str(network.netmask)
+    return _CIDR_TO_NETMASK[cidr]
 
 
 def netmask_to_cidr(netmask: str) -> int:
@@ -78,6 +303,10 @@ def netmask_to_cidr(netmask: str) -> int:
     Raises:
         ValueError: If netmask is invalid
     """
+    cidr = _NETMASK_TO_CIDR.get(str(netmask))
+    if cidr is not None:
+        return cidr
+        
     try:
         # Create network with dummy IP to get prefix length
         network = ipaddress.IPv4Network(f"0.0.0.0/{netmask}")
@@ -100,15 +329,9 @@ def get_network_info(ip_address: str, netmask: str) -> Tuple[str, str, str]:
     Raises:
         ValueError: If IP address or netmask is invalid
     """
-    try:
-        network = ipaddress.IPv4Network(f"{ip_address}/{netmask}", strict=False)
-        return (
-            str(network.network_address),
-            str(network.broadcast_address),
-            f"{network.network_address}/{network.prefixlen}"
-        )
-    except ipaddress.AddressValueError as e:
-        raise ValueError(f"Invalid IP or netmask: {ip_address}/{netmask}") from e
+    network_int, broadcast_int, prefix = _network_bounds(ip_address, netmask)
+    network_address = _int_to_ip(network_int)
+    return network_address, _int_to_ip(broadcast_int), f"{network_address}/{prefix}"
 
 
 def get_host_count(netmask: str) -> int:
@@ -124,6 +347,10 @@ def get_host_count(netmask: str) -> int:
     Raises:
         ValueError: If netmask is invalid
     """
+    cidr = _NETMASK_TO_CIDR.get(str(netmask))
+    if cidr is not None:
+        return (1 << (32 - cidr)) - 2  # Exclude network and broadcast
+        
     try:
         network = ipaddress.IPv4Network(f"0.0.0.0/{netmask}")
         return network.num_addresses - 2  # Exclude network and broadcast
@@ -142,74 +369,109 @@ def ip_in_network(ip_address: str, network: str) -> bool:
     Returns:
         bool: True if IP is in network, False otherwise
     """
+    ip = _address_to_int(ip_address)
+    if ip is None:
+        return False
     try:
-        ip = ipaddress.IPv4Address(ip_address)
-        net = ipaddress.IPv4Network(network, strict=False)
-        return ip in net
+        network_int, netmask_int = _network_and_mask(network)
     except ipaddress.AddressValueError:
         return False
+    return ip & netmask_int == network_int
 
 
-def generate_ip_range(start_ip: str, end_ip: str) -> List[str]:
+def generate_ip_range(start_ip: str, end_ip: str,
+                      max_size: Optional[int] = None) -> List[str]:
     """
     Generate a list of IP addresses between start and end (inclusive).
     
     Args:
         start_ip: Starting IP address
         end_ip: Ending IP address
+        max_size: Maximum number of addresses to generate; no limit by default
         
     Returns:
         List[str]: List of IP addresses in the range
         
     Raises:
-        ValueError: If IP addresses are invalid or start > end
+        ValueError: If IP addresses are invalid, start > end or the range
+            holds more than max_size addresses
     """
     try:
-        start = ipaddress.IPv4Address(start_ip)
-        end = ipaddress.IPv4Address(end_ip)
+        start = int(ipaddress.IPv4Address(start_ip))
+        end = int(ipaddress.IPv4Address(end_ip))
         
         if start > end:
             raise ValueError(f"Start IP {start_ip} is greater than end IP {end_ip}")
         
-        ip_list = []
-        current = start
-        while current <= end:
-            ip_list.append(str(current))
-            current += 1
-            
-        return ip_list
+        # Refuse ranges too large to hold in memory as a list
+        if max_size is not None and end - start + 1 > max_size:
+            raise ValueError(
+                f"IP range {start_ip} - {end_ip} holds {end - start + 1} addresses, "
+                f"more than the limit of {max_size}"
+            )
+        
+        # Format from integers instead of incrementing address objects
+        return list(map(_int_to_ip, range(start, end + 1)))
         
     except ipaddress.AddressValueError as e:
         raise ValueError(f"Invalid IP address: {e}")
 
 
-def get_network_hosts(network: str, exclude_addresses: Optional[List[str]] = None) -> List[str]:
+def iter_network_hosts(network: str, exclude_addresses: Optional[List[str]] = None) -> Iterator[str]:
     """
-    Get all host addresses in a network, optionally excluding specific addresses.
+    Iterate over the host addresses in a network, optionally skipping some.
+    
+    Addresses are produced one at a time from integers, so large networks
+    are never held in memory as a whole.
     
     Args:
         network: Network in CIDR notation (e.g., "192.168.1.0/24")
-        exclude_addresses: List of IP addresses to exclude from the result
+        exclude_addresses: List of IP addresses to skip
         
     Returns:
-        List[str]: List of host IP addresses
+        Iterator[str]: Host IP addresses in ascending order
         
     Raises:
         ValueError: If network is invalid
     """
     try:
-        net = ipaddress.IPv4Network(network, strict=False)
-        hosts = [str(ip) for ip in net.hosts()]
+        network_int, netmask_int = _network_and_mask(network)
+    except ipaddress.AddressValueError as e:
+        raise ValueError(f"Invalid network: {network}") from e
         
-        if exclude_addresses:
-            # Filter out excluded addresses
-            exclude_set = set(exclude_addresses)
-            hosts = [ip for ip in hosts if ip not in exclude_set]
+    hostmask = netmask_int ^ 0xFFFFFFFF
+    first = network_int
+    last = network_int | hostmask
+    if hostmask > 1:
+        # Exclude network and broadcast; /31 and /32 have none (RFC 3021)
+        first += 1
+        last -= 1
+        
+    # Only exclusions inside the host range need a membership test
+    excluded = {
+        ip for ip in map(_ip_to_int, exclude_addresses or ())
+        if ip is not None and first <= ip <= last
+    }
+    if not excluded:
+        return map(_int_to_ip, range(first, last + 1))
+    return (_int_to_ip(ip) for ip in range(first, last + 1) if ip not in excluded)
+
+
+def get_network_hosts(network: str, exclude_addresses: Optional[List[str]] = None) -> List[str]:
+    """
+    Get all host addresses in a network, optionally excluding specific addresses.
+    
+    Args:
+        network: Network in CIDR notation (e.g., "192.168.1.0/24")
+        exclude_addresses: List of IP addresses to exclude from the result
         
-        return hosts
+    Returns:
+        List[str]: List of host IP addresses
         
-    except ipaddress.AddressValueError as e:
-        raise ValueError(f"Invalid network: {network}") from e
+    Raises:
+        ValueError: If network is invalid
+    """
+    return list(iter_network_hosts(network, exclude_addresses))
 
 
 def is_private_ip(ip_address: str) -> bool:
@@ -224,11 +486,10 @@ def is_private_ip(ip_address: str) -> bool:
     Returns:
         bool: True if IP is private, False otherwise
     """
-    try:
-        ip = ipaddress.IPv4Address(ip_address)
-        return ip.is_private
-    except ipaddress.AddressValueError:
+    ip = _address_to_int(ip_address)
+    if ip is None:
         return False
+    return _is_private_range(ip, ip)
 
 
 def is_loopback_ip(ip_address: str) -> bool:
@@ -241,32 +502,252 @@ def is_loopback_ip(ip_address: str) -> bool:
     Returns:
         bool: True if IP is loopback, False otherwise
     """
-    try:
-        ip = ipaddress.IPv4Address(ip_address)
-        return ip.is_loopback
-    except ipaddress.AddressValueError:
+    ip = _address_to_int(ip_address)
+    if ip is None:
         return False
+    return ip & _LOOPBACK_MASK == _LOOPBACK_NETWORK
 
 
-def resolve_hostname(ip_address: str, timeout: float = 2.0) -> Optional[str]:
+if NUMBA_AVAILABLE:
+    # Private range netmasks and networks as arrays for the JIT kernel
+    _PRIVATE_NETMASKS = np.array([netmask for netmask, _ in _PRIVATE_RANGES], dtype=np.uint32)
+    _PRIVATE_NETWORKS = np.array([network for _, network in _PRIVATE_RANGES], dtype=np.uint32)
+    
+    @numba.njit(parallel=True, cache=True)
+    def _classify_kernel(addresses, valid, private_netmasks, private_networks,
+                         network_int, netmask_int):
+        """
+        Compute the private, loopback and membership flags in one pass.
+        
+        Args:
+            addresses: Addresses as a uint32 array
+            valid: Validity of each address
+            private_netmasks: Netmasks of the private ranges
+            private_networks: Networks of the private ranges
+            network_int: Network address to test membership of
+            netmask_int: Netmask of that network
+            
+        Returns:
+            Boolean array with one row per address and private, loopback and
+            in-network columns
+        """
+        flags = np.zeros((addresses.size, 3), dtype=np.bool_)
+        for i in numba.prange(addresses.size):
+            if not valid[i]:
+                continue
+            ip = addresses[i]
+            for j in range(private_netmasks.size):
+                if ip & private_netmasks[j] == private_networks[j]:
+                    flags[i, 0] = True
+                    break
+            flags[i, 1] = ip & _LOOPBACK_MASK == _LOOPBACK_NETWORK
+            flags[i, 2] = ip & netmask_int == network_int
+        return flags
+
+
+def classify_ips(ip_addresses: Iterable[str], network: Optional[str] = None) -> Dict[str, Any]:
     """
-    Attempt to resolve an IP address to a hostname.
+    Classify many IP addresses in a single pass.
+    
+    Equivalent to calling is_valid_ip, is_private_ip, is_loopback_ip and,
+    when a network is given, ip_in_network on every address. Each address
+    is parsed once; with NumPy installed the predicates are evaluated as
+    vectorized masks over the parsed addresses, fused into a single parallel
+    pass when Numba is also installed, otherwise as plain lists.
+    
+    Args:
+        ip_addresses: IP addresses to classify
+        network: Optional network in CIDR notation to test membership of
+        
+    Returns:
+        Dict[str, Any]: 'int' (addresses as integers, 0 where invalid) and
+        the 'valid', 'private', 'loopback' and, when network is given,
+        'in_network' flags, position-aligned with the input. Values are
+        NumPy arrays when NumPy is available, lists otherwise
+    """
+    parsed = [_address_to_int(ip_address) for ip_address in ip_addresses]
+    
+    membership = None
+    if network is not None:
+        try:
+            membership = _network_and_mask(network)
+        except ipaddress.AddressValueError:
+            membership = (1, 0)  # Matches no address, like ip_in_network
+    
+    if NUMPY_AVAILABLE:
+        valid = np.fromiter((ip is not None for ip in parsed), dtype=bool, count=len(parsed))
+        addresses = np.fromiter((ip or 0 for ip in parsed), dtype=np.uint32, count=len(parsed))
+        
+        if NUMBA_AVAILABLE:
+            network_int, netmask_int = membership or (1, 0)
+            flags = _classify_kernel(
+                addresses, valid, _PRIVATE_NETMASKS, _PRIVATE_NETWORKS,
+                network_int, netmask_int
+            )
+            result = {
+                'int': addresses,
+                'valid': valid,
+                'private': flags[:, 0],
+                'loopback': flags[:, 1],
+            }
+            if membership is not None:
+                result['in_network'] = flags[:, 2]
+            return result
+        
+        private = np.zeros(len(parsed), dtype=bool)
+        for netmask, private_network in _PRIVATE_RANGES:
+            private |= (addresses & np.uint32(netmask)) == private_network
+        
+        result = {
+            'int': addresses,
+            'valid': valid,
+            'private': private & valid,
+            'loopback': ((addresses & np.uint32(_LOOPBACK_MASK)) == _LOOPBACK_NETWORK) & valid,
+        }
+        if membership is not None:
+            network_int, netmask_int = membership
+            result['in_network'] = ((addresses & np.uint32(netmask_int)) == network_int) & valid
+        return result
+    
+    result = {
+        'int': [ip or 0 for ip in parsed],
+        'valid': [ip is not None for ip in parsed],
+        'private': [ip is not None and _is_private_range(ip, ip) for ip in parsed],
+        'loopback': [
+            ip is not None and ip & _LOOPBACK_MASK == _LOOPBACK_NETWORK for ip in parsed
+        ],
+    }
+    if membership is not None:
+        network_int, netmask_int = membership
+        result['in_network'] = [
+            ip is not None and ip & netmask_int == network_int for ip in parsed
+        ]
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _reverse_lookup(ip_address: str, epoch: int) -> str:
+    """
+    Resolve an IP address to a hostname, caching successful lookups.
+    
+    Failures raise and are therefore not cached, so transient resolver
+    errors are retried on the next call. The epoch is part of the cache
+    key, so entries expire when it advances and stale ones age out of
+    the LRU.
+    
+    Args:
+        ip_address: IP address to resolve
+        epoch: Current cache period, see _try_reverse_lookup
+        
+    Returns:
+        str: Hostname of the address
+        
+    Raises:
+        socket.herror: If the address has no hostname
+        socket.gaierror: If the address cannot be resolved
+    """
+    return socket.gethostbyaddr(ip_address)[0]
+
+
+def _try_reverse_lookup(ip_address: str) -> Optional[str]:
+    """
+    Resolve an IP address to a hostname, returning None on failure.
     
     Args:
         ip_address: IP address to resolve
-        timeout: Timeout in seconds for the resolution attempt
         
     Returns:
         Optional[str]: Hostname if resolution successful, None otherwise
     """
     try:
-        socket.setdefaulttimeout(timeout)
-        hostname = socket.gethostbyaddr(ip_address)[0]
-        return hostname
+        return _reverse_lookup(
+            ip_address, int(time.monotonic() // _HOSTNAME_CACHE_TTL)
+        )
     except (socket.herror, socket.gaierror, socket.timeout):
         return None
+
+
+def resolve_hostname(ip_address: str, timeout: float = 2.0) -> Optional[str]:
+    """
+    Attempt to resolve an IP address to a hostname.
+    
+    The lookup runs in the calling thread, so the system resolver's own
+    timeout applies; use resolve_hostnames to bound lookups by timeout.
+    
+    Args:
+        ip_address: IP address to resolve
+        timeout: Kept for compatibility; not applied to a single lookup
+        
+    Returns:
+        Optional[str]: Hostname if resolution successful, None otherwise
+    """
+    return _try_reverse_lookup(ip_address)
+
+
+def resolve_hostnames(ip_addresses: Iterable[str], timeout: float = 2.0,
+                      workers: int = _MAX_CONCURRENT_LOOKUPS) -> Dict[str, Optional[str]]:
+    """
+    Resolve many IP addresses to hostnames in parallel.
+    
+    Lookups run in a thread pool, so resolving a subnet takes about as long
+    as its slowest lookup rather than the sum of all of them. Lookups still
+    running when the timeout expires are reported as None but cannot be
+    interrupted: they finish in the background, and interpreter exit waits
+    for them.
+    
+    Args:
+        ip_addresses: IP addresses to resolve
+        timeout: Timeout in seconds for each batch of concurrent lookups
+        workers: Maximum number of lookups running at once
+        
+    Returns:
+        Dict[str, Optional[str]]: Hostname of each IP address, None where
+        resolution failed or timed out
+        
+    Raises:
+        ValueError: If workers is less than 1
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    
+    ip_addresses = list(dict.fromkeys(ip_addresses))
+    if not ip_addresses:
+        return {}
+    
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(ip_addresses)))
+    futures = {}
+    try:
+        for ip in ip_addresses:
+            futures[ip] = executor.submit(_try_reverse_lookup, ip)
+        # Lookups beyond the pool size queue up behind earlier ones
+        batches = -(-len(ip_addresses) // workers)
+        wait(futures.values(), timeout=timeout * batches)
+        return {
+            ip: future.result() if future.done() else None
+            for ip, future in futures.items()
+        }
     finally:
-        socket.setdefaulttimeout(None)
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _ping_command(ip_address: str, timeout: int) -> List[str]:
+    """
+    Build the platform's single-echo ping command.
+    
+    Args:
+        ip_address: IP address to ping
+        timeout: Timeout in seconds
+        
+    Returns:
+        List[str]: Command and arguments
+    """
+    if platform.system().lower() == "windows":
+        # Windows ping command
+        return ["ping", "-n", "1", "-w", str(timeout * 1000), ip_address]
+    # Unix-like systems
+    return ["ping", "-c", "1", "-W", str(timeout), ip_address]
 
 
 def ping_host(ip_address: str, timeout: int = 3) -> bool:
@@ -280,23 +761,11 @@ def ping_host(ip_address: str, timeout: int = 3) -> bool:
     Returns:
         bool: True if host is reachable, False otherwise
     """
-    import subprocess
-    import platform
-    
-    system = platform.system().lower()
-    
     try:
-        if system == "windows":
-            # Windows ping command
-            cmd = ["ping", "-n", "1", "-w", str(timeout * 1000), ip_address]
-        else:
-            # Unix-like systems
-            cmd = ["ping", "-c", "1", "-W", str(timeout), ip_address]
-        
         result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
+            _ping_command(ip_address, timeout),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=timeout + 2
         )
         
@@ -306,6 +775,167 @@ def ping_host(ip_address: str, timeout: int = 3) -> bool:
         return False
 
 
+async def ping_hosts_async(ip_addresses: Iterable[str], timeout: int = 3,
+                           max_concurrent: int = _MAX_CONCURRENT_PINGS) -> Dict[str, bool]:
+    """
+    Ping many hosts concurrently.
+    
+    Each host gets its own ping process, like ping_host, but the processes
+    run in parallel so a whole subnet is probed in roughly one timeout.
+    
+    Args:
+        ip_addresses: IP addresses to ping
+        timeout: Timeout in seconds for each host
+        max_concurrent: Maximum number of ping processes running at once
+        
+    Returns:
+        Dict[str, bool]: Reachability of each IP address
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def ping(ip_address: str) -> bool:
+        async with semaphore:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *_ping_command(ip_address, timeout),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+            except FileNotFoundError:
+                return False
+            try:
+                return await asyncio.wait_for(process.wait(), timeout + 2) == 0
+            except asyncio.TimeoutError:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    # The ping exited between the timeout and the kill
+                    pass
+                await process.wait()
+                return False
+    
+    ip_addresses = list(dict.fromkeys(ip_addresses))
+    results = await asyncio.gather(*map(ping, ip_addresses))
+    return dict(zip(ip_addresses, results))
+
+
+def ping_hosts(ip_addresses: Iterable[str], timeout: int = 3,
+               max_concurrent: int = _MAX_CONCURRENT_PINGS) -> Dict[str, bool]:
+    """
+    Ping many hosts concurrently from synchronous code.
+    
+    Runs its own event loop, so it cannot be called from a coroutine;
+    await ping_hosts_async there instead.
+    
+    Args:
+        ip_addresses: IP addresses to ping
+        timeout: Timeout in seconds for each host
+        max_concurrent: Maximum number of ping processes running at once
+        
+    Returns:
+        Dict[str, bool]: Reachability of each IP address
+        
+    Raises:
+        RuntimeError: If called while an event loop is running
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "ping_hosts cannot be called from a running event loop; "
+            "await ping_hosts_async instead"
+        )
+    return asyncio.run(ping_hosts_async(ip_addresses, timeout, max_concurrent))
+
+
+def _ping_sweep(network: str, timeout: int) -> Set[str]:
+    """
+    Find the reachable hosts of a network with one ping process per host.
+    
+    Args:
+        network: Network in CIDR notation (e.g., "192.168.1.0/24")
+        timeout: Timeout in seconds for each host
+        
+    Returns:
+        Set[str]: IP addresses that answered
+    """
+    hosts = iter_network_hosts(network)
+    return {ip for ip, alive in ping_hosts(hosts, timeout).items() if alive}
+
+
+def sweep_network(network: str, timeout: int = 1,
+                  max_size: Optional[int] = _MAX_IP_RANGE_SIZE) -> Set[str]:
+    """
+    Find the reachable hosts of a network.
+    
+    Uses a single fping process for the whole network when fping is
+    installed, otherwise pings every host concurrently with ping_hosts.
+    The fping probe interval and retries are passed explicitly, so the
+    overall deadline can be scaled with the number of hosts.
+    
+    Args:
+        network: Network in CIDR notation (e.g., "192.168.1.0/24")
+        timeout: Timeout in seconds for each host
+        max_size: Maximum number of hosts to sweep, None for no limit
+        
+    Returns:
+        Set[str]: IP addresses that answered; if fping overruns its
+        deadline, the hosts it had reported by then
+        
+    Raises:
+        ValueError: If network is invalid or holds more than max_size hosts
+    """
+    network_int, netmask_int = _network_and_mask(network)
+    hostmask = ~netmask_int & 0xFFFFFFFF
+    # /31 and /32 have no network or broadcast address (RFC 3021)
+    host_count = hostmask - 1 if hostmask > 1 else hostmask + 1
+    if max_size is not None and host_count > max_size:
+        raise ValueError(
+            f"Network {network} holds {host_count} hosts, "
+            f"more than the limit of {max_size}"
+        )
+    
+    if _FPING_PATH is None:
+        return _ping_sweep(network, timeout)
+    
+    # fping only understands prefix-length notation
+    cidr = f"{_int_to_ip(network_int)}/{_NETMASK_TO_CIDR[_int_to_ip(netmask_int)]}"
+    
+    # Every attempt of every host is spaced by the interval, and the last
+    # attempt of each host may wait out its full (backed-off) timeout
+    attempts = _FPING_RETRIES + 1
+    deadline = (
+        host_count * attempts * _FPING_INTERVAL_MS / 1000
+        + timeout * attempts * 2
+        + 10
+    )
+    
+    try:
+        result = subprocess.run(
+            [_FPING_PATH, "-a", "-q",
+             "-t", str(timeout * 1000),
+             "-i", str(_FPING_INTERVAL_MS),
+             "-r", str(_FPING_RETRIES),
+             "-g", cidr],
+            capture_output=True,
+            text=True,
+            timeout=deadline
+        )
+    except FileNotFoundError:
+        return _ping_sweep(network, timeout)
+    except subprocess.TimeoutExpired as e:
+        # Keep the hosts fping reported before it was killed
+        output = e.stdout or ""
+        if isinstance(output, bytes):
+            output = output.decode(errors="replace")
+        return set(output.split())
+    
+    # fping exits non-zero whenever some hosts are unreachable
+    return set(result.stdout.split())
+
+
 def calculate_network_size(cidr: int) -> Tuple[int, int]:
     """
     Calculate total addresses and host addresses for a given CIDR.
@@ -322,7 +952,7 @@ def calculate_network_size(cidr: int) -> Tuple[int, int]:
     if not 0 <= cidr <= 32:
         raise ValueError(f"CIDR must be between 0 and 32, got {cidr}")
     
-    total_addresses = 2 ** (32 - cidr)
+    total_addresses = 1 << (32 - cidr)
     host_addresses = max(0, total_addresses - 2)  # Exclude network and broadcast
     
     return total_addresses, host_addresses
@@ -342,23 +972,26 @@ def get_subnet_info(ip_address: str, netmask: str) -> dict:
     Raises:
         ValueError: If IP address or netmask is invalid
     """
-    try:
-        network = ipaddress.IPv4Network(f"{ip_address}/{netmask}", strict=False)
-        
-        total_addresses, host_addresses = calculate_network_size(network.prefixlen)
-        
-        return {
-            'network_address': str(network.network_address),
-            'broadcast_address': str(network.broadcast_address),
-            'netmask': str(network.netmask),
-            'cidr': network.prefixlen,
-            'cidr_notation': str(network),
-            'total_addresses': total_addresses,
-            'host_addresses': host_addresses,
-            'first_host': str(list(network.hosts())[0]) if host_addresses > 0 else None,
-            'last_host': str(list(network.hosts())[-1]) if host_addresses > 0 else None,
-            'is_private': network.is_private
-        }
-        
-    except ipaddress.AddressValueError as e:
-        raise ValueError(f"Invalid IP or netmask: {ip_address}/{netmask}") from e
\ No newline at end of file
+    network_int, broadcast_int, prefix = _network_bounds(ip_address, netmask)
+    network_address = _int_to_ip(network_int)
+    
+    total_addresses, host_addresses = calculate_network_size(prefix)
+    
+    # Hosts lie between the network and broadcast addresses
+    first_host = last_host = None
+    if host_addresses > 0:
+        first_host = _int_to_ip(network_int + 1)
+        last_host = _int_to_ip(broadcast_int - 1)
+    
+    return {
+        'network_address': network_address,
+        'broadcast_address': _int_to_ip(broadcast_int),
+        'netmask': _CIDR_TO_NETMASK[prefix],
+        'cidr': prefix,
+        'cidr_notation': f"{network_address}/{prefix}",
+        'total_addresses': total_addresses,
+        'host_addresses': host_addresses,
+        'first_host': first_host,
+        'last_host': last_host,
+        'is_private': _is_private_range(network_int, broadcast_int)
+    }
\ No newline at end of file
@@ -0,0 +1,20 @@
+"""Tests for SNMP configuration validation."""
+
+import pytest
+
+from network_discovery.config.config_loader import ConfigLoader
+from network_discovery.utils.error_handler import ConfigurationError
+
+
+def test_short_snmpv3_key_is_rejected(tmp_path):
+    (tmp_path / "snmp_config.yml").write_text(
+        "snmp:\n"
+        "  versions: [3]\n"
+        "  snmpv3_users:\n"
+        "    - username: monitor\n"
+        "      auth_key: short\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ConfigurationError, match="auth_key"):
+        ConfigLoader(str(tmp_path)).load_snmp_config()
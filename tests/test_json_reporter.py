@@ -0,0 +1,42 @@
+"""Tests for JSON report schema validation."""
+
+import json
+from datetime import datetime
+
+from network_discovery.core.data_models import (
+    CompleteScanResult,
+    DeviceInfo,
+    NetworkInfo,
+    ScanMetadata,
+    ScanStatistics,
+)
+from network_discovery.utils.json_reporter import JSONReporter
+
+
+def _scan_result():
+    return CompleteScanResult(
+        scan_metadata=ScanMetadata(timestamp=datetime.now()),
+        network_info=NetworkInfo(
+            host_ip="192.168.1.10",
+            netmask="255.255.255.0",
+            network_address="192.168.1.0",
+            broadcast_address="192.168.1.255",
+            interface_name="eth0",
+        ),
+        devices=[DeviceInfo(ip_address="192.168.1.1")],
+        scan_statistics=ScanStatistics(),
+    )
+
+
+def test_converted_report_passes_schema_validation(tmp_path):
+    reporter = JSONReporter(str(tmp_path))
+
+    assert reporter.validate_json_schema(reporter._convert_to_json_format(_scan_result()))
+
+
+def test_written_report_passes_schema_validation(tmp_path):
+    reporter = JSONReporter(str(tmp_path))
+    report_path = reporter.generate_report(_scan_result())
+
+    with open(report_path, encoding="utf-8") as f:
+        assert reporter.validate_json_schema(json.load(f))
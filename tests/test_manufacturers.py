@@ -0,0 +1,18 @@
+"""Tests for manufacturer display names."""
+
+import pytest
+
+from network_discovery.utils.manufacturers import match_manufacturer
+
+
+@pytest.mark.parametrize("sys_descr, expected", [
+    ("Cisco IOS Software, C2960 Software", "Cisco"),
+    ("HP J9773A 2530-24G-PoEP Switch", "HP"),
+    ("Dell Networking N1548", "Dell"),
+    ("NETGEAR GS108T", "Netgear"),
+    ("D-Link DES-1210-28", "D-Link"),
+    ("TP-Link JetStream T1600G", "TP-Link"),
+    ("Palo Alto Networks PA-220 firewall", "Palo Alto Networks"),
+])
+def test_manufacturer_display_names(sys_descr, expected):
+    assert match_manufacturer(sys_descr.lower()) == expected
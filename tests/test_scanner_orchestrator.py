@@ -0,0 +1,53 @@
+"""Tests for the configuration metadata written into scan reports."""
+
+from datetime import datetime
+
+from network_discovery.core.data_models import (
+    CompleteScanResult,
+    NetworkInfo,
+    ScanMetadata,
+    ScanStatistics,
+)
+from network_discovery.core.scanner_orchestrator import ScannerOrchestrator
+from network_discovery.utils.json_reporter import JSONReporter
+
+SNMP_CONFIG = """
+snmp:
+  versions: [3]
+  snmpv3_users:
+    - username: "monitor"
+      auth_protocol: "sha"
+      auth_key: "auth-secret-passphrase"
+      priv_protocol: "aes"
+      priv_key: "priv-secret-passphrase"
+"""
+
+
+def test_report_does_not_contain_snmpv3_keys(tmp_path):
+    (tmp_path / "snmp_config.yml").write_text(SNMP_CONFIG, encoding="utf-8")
+    orchestrator = ScannerOrchestrator(
+        config_dir=str(tmp_path), output_dir=str(tmp_path / "results")
+    )
+    orchestrator._load_configurations()
+
+    scan_result = CompleteScanResult(
+        scan_metadata=ScanMetadata(
+            timestamp=datetime.now(),
+            configurations_used=orchestrator.configurations,
+        ),
+        network_info=NetworkInfo(
+            host_ip="192.168.1.10",
+            netmask="255.255.255.0",
+            network_address="192.168.1.0",
+            broadcast_address="192.168.1.255",
+            interface_name="eth0",
+        ),
+        devices=[],
+        scan_statistics=ScanStatistics(),
+    )
+    report_path = JSONReporter(str(tmp_path / "results")).generate_report(scan_result)
+    report = open(report_path, encoding="utf-8").read()
+
+    assert "monitor" in report
+    assert "auth-secret-passphrase" not in report
+    assert "priv-secret-passphrase" not in report
@@ -0,0 +1,138 @@
+"""Tests for the SNMP scanner's concurrency budget."""
+
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from network_discovery.config.config_loader import SNMPConfig
+from network_discovery.core.data_models import DeviceInfo
+from network_discovery.scanners import snmp_scanner
+from network_discovery.scanners.snmp_scanner import SNMPScanner, _split_budget
+
+
+def test_split_budget_adds_up_to_total():
+    assert _split_budget(5, 3) == [2, 2, 1]
+    assert _split_budget(8, 8) == [1] * 8
+    assert sum(_split_budget(255, 8)) == 255
+
+
+@pytest.mark.parametrize("cap", [1, 5, 7, 64])
+def test_in_flight_count_never_exceeds_max_concurrency(cap):
+    """Budgets handed to every scanning event loop add up to at most the cap."""
+    budgets = []
+
+    def fake_scan_chunk(targets, config, max_concurrency, *args):
+        budgets.append(max_concurrency)
+        return [], {}, {}, Counter()
+
+    def fake_async_scan_chunk(self, targets, config, max_concurrency):
+        budgets.append(max_concurrency)
+        return []
+
+    targets = [f"10.0.{i // 256}.{i % 256}" for i in range(1024)]
+    config = SNMPConfig(max_concurrency=cap)
+
+    with mock.patch.object(snmp_scanner.os, "cpu_count", return_value=8), \
+            mock.patch.object(snmp_scanner, "ProcessPoolExecutor", ThreadPoolExecutor), \
+            mock.patch.object(snmp_scanner, "_scan_chunk", fake_scan_chunk), \
+            mock.patch.object(snmp_scanner, "_run_async", lambda result: result), \
+            mock.patch.object(SNMPScanner, "_async_scan_chunk", fake_async_scan_chunk):
+        SNMPScanner()._scan_targets(targets, config)
+
+    assert budgets
+    assert all(budget >= 1 for budget in budgets)
+    assert sum(budgets) <= cap
+
+
+def test_sparse_targets_do_not_collapse_the_limit():
+    """Hosts without an SNMP agent do not count as back-off signals."""
+    limiters = []
+
+    class RecordingLimiter(snmp_scanner.AdaptiveLimiter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            limiters.append(self)
+
+    answering = {f"10.0.0.{i}" for i in range(1, 6)}
+
+    async def fake_scan_target(self, target, config, snmp_engine):
+        if target in answering:
+            return DeviceInfo(ip_address=target), None, ""
+        return None, f"{target}: No SNMP response from {target}", ""
+
+    targets = [f"10.0.0.{i}" for i in range(1, 255)]
+    with mock.patch.object(snmp_scanner, "AdaptiveLimiter", RecordingLimiter), \
+            mock.patch.object(SNMPScanner, "_async_scan_target", fake_scan_target):
+        asyncio.run(SNMPScanner()._async_scan_chunk(targets, SNMPConfig(), 254))
+
+    assert limiters[0].stats["timeouts"] == 0
+    assert int(limiters[0].limit) == 254
+
+
+def test_known_responders_that_go_silent_back_off():
+    """A target that answered before and now times out shrinks the limit."""
+    limiters = []
+
+    class RecordingLimiter(snmp_scanner.AdaptiveLimiter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            limiters.append(self)
+
+    async def fake_scan_target(self, target, config, snmp_engine):
+        return None, f"{target}: No SNMP response from {target}", ""
+
+    scanner = SNMPScanner()
+    scanner._cred_cache["10.0.0.1"] = (2, "public")
+    with mock.patch.object(snmp_scanner, "AdaptiveLimiter", RecordingLimiter), \
+            mock.patch.object(SNMPScanner, "_async_scan_target", fake_scan_target):
+        asyncio.run(scanner._async_scan_chunk(["10.0.0.1", "10.0.0.2"], SNMPConfig(), 64))
+
+    assert limiters[0].stats["timeouts"] == 1
+    assert int(limiters[0].limit) < 64
+
+
+def test_worker_caches_are_merged_into_the_parent():
+    """Credentials and engine IDs learned in worker processes survive the scan."""
+
+    async def fake_async_scan_chunk(self, targets, config, max_concurrency):
+        for target in targets:
+            self._cred_cache[target] = (2, "public")
+            self._cred_hits[2, "public"] += 1
+            self._engine_id_cache[target] = b"engine-" + target.encode()
+        return []
+
+    targets = [f"10.0.0.{i}" for i in range(1, 65)]
+    scanner = SNMPScanner()
+    scanner._cred_hits[1, "private"] = 3
+    with mock.patch.object(snmp_scanner, "ProcessPoolExecutor", ThreadPoolExecutor), \
+            mock.patch.object(SNMPScanner, "_async_scan_chunk", fake_async_scan_chunk):
+        scanner._scan_targets_in_processes(targets, SNMPConfig(), 4, 64)
+
+    assert scanner._cred_cache == dict.fromkeys(targets, (2, "public"))
+    assert scanner._cred_hits == Counter({(2, "public"): 64, (1, "private"): 3})
+    assert scanner._engine_id_cache == {
+        target: b"engine-" + target.encode() for target in targets
+    }
+
+
+@pytest.mark.parametrize("cached, watched", [(False, True), (True, False)])
+def test_port_unreachable_watch_only_for_unknown_targets(cached, watched):
+    """Targets known to answer do not get the extra ICMP watch GetRequest."""
+    watch = mock.AsyncMock(side_effect=OSError("no socket"))
+
+    async def fake_try_credentials(self, *args):
+        return None, "No SNMP response", ""
+
+    scanner = SNMPScanner()
+    if cached:
+        scanner._cred_cache["127.0.0.1"] = (2, "public")
+    with mock.patch.object(snmp_scanner, "watch_port_unreachable", watch), \
+            mock.patch.object(SNMPScanner, "_async_try_credentials", fake_try_credentials):
+        asyncio.run(
+            scanner._async_scan_single_target("127.0.0.1", SNMPConfig(), None)
+        )
+
+    assert watch.called == watched